@@ -9,8 +9,9 @@ import hmac
 import json
 import logging
 import secrets
-from collections.abc import Callable
-from datetime import UTC, datetime, timedelta
+import time
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlencode
@@ -25,6 +26,8 @@ logger = logging.getLogger("pyrest.auth")
 
 ERROR_INSUFFICIENT_PERMISSIONS = "Insufficient permissions"
 
+_SECONDS_PER_HOUR = 3600
+
 
 
 class AuthConfig:
@@ -162,11 +165,13 @@ class JWTAuth:
 
     def generate_token(self, payload: dict[str, Any]) -> str:
         """Generate a JWT token with the given payload."""
-        now = datetime.now(UTC)
+        # Integer epoch seconds avoid building datetime objects that PyJWT
+        # would only convert back to timestamps.
+        now = int(time.time())
         token_payload = {
             **payload,
             "iat": now,
-            "exp": now + timedelta(hours=self.expiry_hours),
+            "exp": now + self.expiry_hours * _SECONDS_PER_HOUR,
             "iss": "pyrest",
         }
         return jwt.encode(token_payload, self.secret, algorithm=self.algorithm)
@@ -633,6 +638,11 @@ def azure_ad_authenticated(method: Callable) -> Callable:
     return wrapper
 
 
+def _normalize_roles(roles: Iterable[str]) -> frozenset[str]:
+    """Lower-case role names into a frozenset for case-insensitive matching."""
+    return frozenset(role.lower() for role in roles)
+
+
 def require_azure_roles(allowed_roles: list[str]) -> Callable:
     """
     Decorator for requiring specific Azure AD app roles.
@@ -656,7 +666,18 @@ def require_azure_roles(allowed_roles: list[str]) -> Callable:
         2. Click "App roles" in the left menu
         3. Create roles (e.g., "Admin", "Reader", "DataManager")
         4. Assign roles to users/groups in "Enterprise Applications"
+
+    Role names are compared case-insensitively, since Azure AD does not
+    guarantee the casing of role claims matches the declared names.
+    Handlers declaring the same role set share a single decorator.
     """
+    return _make_require_azure_roles(tuple(sorted(_normalize_roles(allowed_roles))))
+
+
+@functools.lru_cache(maxsize=128)
+def _make_require_azure_roles(allowed_roles: tuple[str, ...]) -> Callable:
+    """Build the require_azure_roles decorator for a normalized role tuple."""
+    allowed_lower = frozenset(allowed_roles)
 
     def decorator(method: Callable) -> Callable:
         @functools.wraps(method)
@@ -670,7 +691,7 @@ def require_azure_roles(allowed_roles: list[str]) -> Callable:
                 return None
 
             # Check if user has any of the allowed roles
-            if not any(role in azure_roles for role in allowed_roles):
+            if allowed_lower.isdisjoint(_normalize_roles(azure_roles)):
                 self.set_status(403)
                 self.write({"error": ERROR_INSUFFICIENT_PERMISSIONS})
                 return None
@@ -706,6 +727,7 @@ def azure_ad_protected(allowed_roles: list[str] | None = None) -> Callable:
             async def get(self):
                 ...
     """
+    allowed_lower = _normalize_roles(allowed_roles or ())
 
     def decorator(method: Callable) -> Callable:
         @functools.wraps(method)
@@ -746,7 +768,7 @@ def azure_ad_protected(allowed_roles: list[str] | None = None) -> Callable:
                 return None
 
             # Check roles if specified
-            if allowed_roles and not any(role in roles for role in allowed_roles):
+            if allowed_lower and allowed_lower.isdisjoint(_normalize_roles(roles)):
                 self.set_status(403)
                 self.write({"error": ERROR_INSUFFICIENT_PERMISSIONS})
                 return None
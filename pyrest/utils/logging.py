@@ -17,13 +17,24 @@ Usage:
 
 import json
 import logging
+import math
 import sys
+import threading
+import time
 import traceback
-from datetime import UTC, datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from pathlib import Path
 from typing import Any
 
+# Try to import orjson for faster JSON log lines
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 # Default log directory
 DEFAULT_LOG_DIR = "logs"
 
@@ -31,9 +42,26 @@ DEFAULT_LOG_DIR = "logs"
 DEFAULT_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"
 DEFAULT_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# Records held in memory before a buffered app log is written out
+DEFAULT_BUFFER_CAPACITY = 1024
+
 # JSON format for structured logging
 JSON_FORMAT_FIELDS = ["timestamp", "level", "logger", "message", "app", "extra"]
 
+# Attributes every LogRecord carries; anything else on a record came from ``extra=``
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {
+    "message",
+    "asctime",
+    "app",
+}
+
+
+def _json_dumps(obj: Any, default: Any = None) -> str:
+    """Serialize to compact JSON, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, default=default, separators=(",", ":"))
+
 
 class SmartFormatter(logging.Formatter):
     """
@@ -109,10 +137,25 @@ class JSONFormatter(logging.Formatter):
     def __init__(self, app_name: str = "pyrest"):
         super().__init__()
         self.app_name = app_name
+        # (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") of the last record
+        self._second_cache: tuple[int, str] = (-1, "")
+
+    def _format_timestamp(self, created: float) -> str:
+        """Format a record time as UTC ISO 8601, reusing the per-second prefix."""
+        # Same rounding as datetime.fromtimestamp
+        fraction, whole = math.modf(created)
+        second, micros = int(whole), round(fraction * 1_000_000)
+        if micros >= 1_000_000:
+            second, micros = second + 1, micros - 1_000_000
+        cached_second, prefix = self._second_cache
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._second_cache = (second, prefix)
+        return f"{prefix}.{micros:06d}+00:00"
 
     def format(self, record: logging.LogRecord) -> str:
         log_data = {
-            "timestamp": datetime.now(UTC).isoformat(),
+            "timestamp": self._format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -139,13 +182,9 @@ class JSONFormatter(logging.Formatter):
         # Add any extra fields
         extra = {}
         for key, value in record.__dict__.items():
-            if (
-                key not in logging.LogRecord.__dict__
-                and not key.startswith("_")
-                and key not in ["message", "asctime", "app"]
-            ):
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
                 try:
-                    json.dumps(value)  # Check if serializable
+                    _json_dumps(value)  # Check if serializable
                     extra[key] = value
                 except (TypeError, ValueError):
                     extra[key] = str(value)
@@ -153,7 +192,7 @@ class JSONFormatter(logging.Formatter):
         if extra:
             log_data["extra"] = extra
 
-        return json.dumps(log_data, default=str)
+        return _json_dumps(log_data, default=str)
 
 
 class AppLogger:
@@ -173,6 +212,8 @@ class AppLogger:
         backup_count: int = 5,
         use_json: bool = False,
         console_output: bool = False,
+        *,
+        buffered: bool = False,
     ):
         """
         Initialize app-specific logger.
@@ -185,6 +226,8 @@ class AppLogger:
             backup_count: Number of backup files to keep
             use_json: Use JSON formatting for structured logs
             console_output: Also output to console
+            buffered: Batch writes to the main log file in memory; ERROR and above
+                flush the batch immediately
         """
         self.app_name = app_name
         self.log_dir = Path(log_dir)
@@ -193,6 +236,7 @@ class AppLogger:
         self.backup_count = backup_count
         self.use_json = use_json
         self.console_output = console_output
+        self.buffered = buffered
 
         # Create logger
         self.logger = logging.getLogger(f"pyrest.app.{app_name}")
@@ -204,7 +248,12 @@ class AppLogger:
 
     def _setup_handlers(self) -> None:
         """Setup file and console handlers."""
-        # Clear existing handlers
+        # Close and clear existing handlers (flushes any buffered records)
+        for handler in self.logger.handlers:
+            target = getattr(handler, "target", None)
+            handler.close()
+            if target is not None:
+                target.close()
         self.logger.handlers.clear()
 
         # Ensure log directory exists
@@ -233,7 +282,16 @@ class AppLogger:
                 )
             )
 
-        self.logger.addHandler(file_handler)
+        if self.buffered:
+            buffer_handler = MemoryHandler(
+                capacity=DEFAULT_BUFFER_CAPACITY,
+                flushLevel=logging.ERROR,
+                target=file_handler,
+            )
+            buffer_handler.setLevel(self.log_level)
+            self.logger.addHandler(buffer_handler)
+        else:
+            self.logger.addHandler(file_handler)
 
         # Optional console handler
         if self.console_output:
@@ -308,6 +366,18 @@ class AppLogger:
             user: Optional user identifier
             extra: Optional extra data to include
         """
+        # Determine log level based on status code
+        if status_code >= 500:
+            level = logging.ERROR
+        elif status_code >= 400:
+            level = logging.WARNING
+        else:
+            level = logging.INFO
+
+        # Skip building the structured payload when the level is filtered out
+        if not self.logger.isEnabledFor(level):
+            return
+
         log_data = {
             "method": method,
             "path": path,
@@ -319,16 +389,14 @@ class AppLogger:
         if extra:
             log_data.update(extra)
 
-        # Determine log level based on status code
-        if status_code >= 500:
-            level = logging.ERROR
-        elif status_code >= 400:
-            level = logging.WARNING
-        else:
-            level = logging.INFO
-
         self.logger.log(
-            level, f"{method} {path} -> {status_code} ({duration_ms:.2f}ms)", extra=log_data
+            level,
+            "%s %s -> %d (%.2fms)",
+            method,
+            path,
+            status_code,
+            duration_ms,
+            extra=log_data,
         )
 
     def log_tm1_operation(
@@ -349,6 +417,10 @@ class AppLogger:
             duration_ms: Optional operation duration
             details: Optional extra details
         """
+        level = logging.INFO if success else logging.ERROR
+        if not self.logger.isEnabledFor(level):
+            return
+
         log_data = {
             "tm1_operation": operation,
             "tm1_instance": instance,
@@ -359,14 +431,20 @@ class AppLogger:
         if details:
             log_data.update(details)
 
-        if success:
-            self.logger.info(f"TM1 [{instance}] {operation}: success", extra=log_data)
-        else:
-            self.logger.error(f"TM1 [{instance}] {operation}: failed", extra=log_data)
+        self.logger.log(
+            level,
+            "TM1 [%s] %s: %s",
+            instance,
+            operation,
+            "success" if success else "failed",
+            extra=log_data,
+        )
 
 
 # Registry of app loggers
 _app_loggers: dict[str, AppLogger] = {}
+# Guards get-or-create; sync handlers can log from executor threads
+_app_loggers_lock = threading.Lock()
 
 
 def setup_app_logging(
@@ -377,6 +455,8 @@ def setup_app_logging(
     backup_count: int = 5,
     use_json: bool = False,
     console_output: bool = False,
+    *,
+    buffered: bool = False,
 ) -> AppLogger:
     """
     Setup logging for an app and return the AppLogger.
@@ -389,6 +469,7 @@ def setup_app_logging(
         backup_count: Number of backup files to keep
         use_json: Use JSON formatting for structured logs
         console_output: Also output to console
+        buffered: Batch writes to the main log file in memory
 
     Returns:
         AppLogger instance
@@ -405,6 +486,7 @@ def setup_app_logging(
         backup_count=backup_count,
         use_json=use_json,
         console_output=console_output,
+        buffered=buffered,
     )
 
     _app_loggers[app_name] = app_logger
@@ -440,6 +522,11 @@ def get_or_create_app_logger(
     Returns:
         AppLogger instance
     """
-    if app_name in _app_loggers:
-        return _app_loggers[app_name]
-    return setup_app_logging(app_name, log_dir, **kwargs)
+    app_logger = _app_loggers.get(app_name)
+    if app_logger is not None:
+        return app_logger
+    with _app_loggers_lock:
+        # Another thread may have created it while we waited for the lock
+        if app_name in _app_loggers:
+            return _app_loggers[app_name]
+        return setup_app_logging(app_name, log_dir, **kwargs)
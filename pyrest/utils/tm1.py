@@ -41,13 +41,19 @@ Advanced Usage:
 import json
 import logging
 import os
+import re
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 logger = logging.getLogger("pyrest.utils.tm1")
 
 DEFAULT_SESSION_CONTEXT = "PyRest TM1 App"
 
+# ${VAR_NAME} or ${VAR_NAME:-default} reference inside a config value
+_ENV_REF_RE = re.compile(r"\$\{([^}]*)\}")
+
 # TM1py import (available when running in isolated venv with tm1py installed)
 try:
     from TM1py import TM1Service
@@ -63,6 +69,12 @@ def is_tm1_available() -> bool:
     return TM1_AVAILABLE
 
 
+def _substitute_env_ref(match: re.Match[str]) -> str:
+    """Replace one ${VAR} / ${VAR:-default} match with its environment value."""
+    var_name, has_default, default = match.group(1).partition(":-")
+    return os.environ.get(var_name.strip(), default if has_default else "")
+
+
 class TM1InstanceConfig:
     """
     Configuration for a single TM1 instance.
@@ -71,6 +83,8 @@ class TM1InstanceConfig:
     variable resolution for sensitive values.
     """
 
+    __slots__ = ("_config", "connection_type", "description", "name")
+
     def __init__(self, name: str, config: dict[str, Any]):
         """
         Initialize TM1 instance configuration.
@@ -90,34 +104,14 @@ class TM1InstanceConfig:
         """
         Resolve environment variable references in config values.
 
-        Supports ${VAR_NAME} and ${VAR_NAME:-default} syntax.
+        Supports ${VAR_NAME} and ${VAR_NAME:-default} syntax. References are
+        substituted in a single pass; environment values are used verbatim, so a
+        secret that itself contains "${" is never expanded again.
         """
-        if not isinstance(value, str):
+        if not isinstance(value, str) or "${" not in value:
             return value
 
-        if value.startswith("${") and "}" in value:
-            # Extract ${VAR:-default} syntax
-            start = value.find("${")
-            end = value.find("}")
-            env_expr = value[start + 2 : end]
-
-            if ":-" in env_expr:
-                var_name, default = env_expr.split(":-", 1)
-                result = os.environ.get(var_name.strip(), default)
-            else:
-                result = os.environ.get(env_expr.strip(), "")
-
-            # Handle prefix/suffix around the ${...}
-            prefix = value[:start]
-            suffix = value[end + 1 :]
-            resolved = prefix + result + suffix
-
-            # Recursively resolve if there are more references
-            if "${" in resolved:
-                return TM1InstanceConfig._resolve_env_value(resolved)
-            return resolved
-
-        return value
+        return _ENV_REF_RE.sub(_substitute_env_ref, value)
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a config value with environment variable resolution."""
@@ -536,9 +530,9 @@ class TM1ConnectionManager:
         return cls._instances.get(name)
 
     @classmethod
-    def get_all_instances(cls) -> dict[str, TM1InstanceConfig]:
-        """Get all configured instances."""
-        return cls._instances.copy()
+    def get_all_instances(cls) -> Mapping[str, TM1InstanceConfig]:
+        """Get a read-only view of all configured instances."""
+        return MappingProxyType(cls._instances)
 
     @classmethod
     def list_instance_names(cls) -> list[str]:
@@ -10,10 +10,14 @@ import logging
 import os
 import shutil
 import sys
+import uuid
 from pathlib import Path
 
 DEFAULT_VENV_NAME = ".venv"
 
+# remove_venv renames a venv to "<prefix><name>-<uuid>" before deleting it
+TRASH_PREFIX = ".trash-"
+
 logger = logging.getLogger("pyrest.venv_manager")
 
 
@@ -41,6 +45,19 @@ async def _run_cmd(*args: str) -> tuple[int, str, str]:
     )
 
 
+def _sweep_trash(directory: Path) -> None:
+    """Delete renamed-away venvs that an earlier remove_venv could not finish."""
+    for trash_path in directory.glob(f"{TRASH_PREFIX}*"):
+        try:
+            if trash_path.is_symlink():
+                trash_path.unlink()
+            else:
+                shutil.rmtree(trash_path)
+            logger.info(f"Deleted leftover venv at {trash_path}")
+        except OSError as e:
+            logger.warning(f"Could not delete leftover venv at {trash_path}: {e}")
+
+
 class VenvManager:
     """
     Manages virtual environments for isolated apps.
@@ -343,18 +360,32 @@ class VenvManager:
             return False, error_msg
 
     async def remove_venv(self, venv_path: Path) -> tuple[bool, str]:
-        """Async: remove a virtual environment directory."""
+        """
+        Async: remove a virtual environment directory.
+
+        The venv is renamed to a hidden sibling before it is deleted. This is only
+        for crash safety: a failed or interrupted delete never leaves a half-removed
+        venv at ``venv_path``. Once the rename succeeds the venv counts as removed;
+        anything the delete leaves behind is swept by ensure_venv.
+        """
         if not venv_path.exists():
             return True, "Venv does not exist"
         try:
-            await asyncio.to_thread(shutil.rmtree, str(venv_path))
-            logger.info(f"Removed venv at {venv_path}")
-            return True, "Venv removed"
+            trash_name = f"{TRASH_PREFIX}{venv_path.name.lstrip('.')}-{uuid.uuid4().hex}"
+            trash_path = venv_path.with_name(trash_name)
+            venv_path.rename(trash_path)
         except Exception as e:
             error_msg = f"Failed to remove venv: {e}"
             logger.exception(error_msg)
             return False, error_msg
 
+        try:
+            await asyncio.to_thread(shutil.rmtree, trash_path)
+        except OSError as e:
+            logger.warning(f"Could not delete old venv at {trash_path}, will retry later: {e}")
+        logger.info(f"Removed venv at {venv_path}")
+        return True, "Venv removed"
+
     async def ensure_venv(self, app_path: Path, venv_name: str = DEFAULT_VENV_NAME) -> tuple[bool, Path, str]:
         """
         Async: ensure a virtual environment exists and has deps installed.
@@ -369,6 +400,10 @@ class VenvManager:
         venv_path = self.get_venv_path(app_path, venv_name).resolve()
         requirements_file = app_path / "requirements.txt"
 
+        # remove_venv leaves trash next to the resolved venv (a symlink's target)
+        for directory in {venv_path.parent, app_path.resolve()}:
+            await asyncio.to_thread(_sweep_trash, directory)
+
         if not requirements_file.exists():
             return True, venv_path, "No requirements.txt found, using parent environment"
 
@@ -7,25 +7,95 @@ import os
 import shutil
 import sys
 import tempfile
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+import jwt
 import pytest
+import pytest_asyncio
+import tornado.httpserver
+import tornado.testing
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Prefer orjson when installed; it parses bytes and str without re-decoding
+try:
+    import orjson
+
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+except ImportError:
+    json_dumps = json.dumps
+    json_loads = json.loads
 
 # Minimum 32-byte secret for HMAC-SHA256 — shared across all test modules
 TEST_JWT_SECRET = "pyrest-test-jwt-secret-key-32b!!"  # 32 bytes
 
+# Memory-backed temp root used when PYREST_FAST_TESTS=1
+_TMPFS_ROOT = Path("/dev/shm")  # noqa: S108
+# Docker caps /dev/shm at 64 MB by default; the copied venvs need more than that
+_TMPFS_MIN_FREE = 512 * 1024 * 1024
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Put pytest's temp directories on tmpfs when PYREST_FAST_TESTS=1 (Linux only).
+
+    The venv tests create and delete whole environments; /dev/shm keeps that off
+    disk. Only the system temp dir is redirected, so pytest keeps its numbered,
+    locked pytest-of-<user> layout and concurrent runs do not clobber each other.
+    A missing or small /dev/shm leaves the default location in place.
+    """
+    if (
+        os.environ.get("PYREST_FAST_TESTS") == "1"
+        and sys.platform == "linux"
+        and _TMPFS_ROOT.is_dir()
+        and shutil.disk_usage(_TMPFS_ROOT).free >= _TMPFS_MIN_FREE
+    ):
+        tempfile.tempdir = str(_TMPFS_ROOT)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _jwt_env() -> Generator[None]:
+    """Expose the test JWT secret via PYREST_JWT_SECRET for the whole session."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("PYREST_JWT_SECRET", TEST_JWT_SECRET)
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _reset_auth() -> None:
+    """Start every test with fresh auth singletons."""
+    import pyrest.auth
+
+    pyrest.auth._auth_manager = None
+    pyrest.auth.AuthConfig._instance = None
+
 
 @pytest.fixture
-def temp_dir() -> Generator[Path]:
-    """Create a temporary directory for tests."""
-    temp_path = Path(tempfile.mkdtemp())
-    yield temp_path
-    shutil.rmtree(temp_path, ignore_errors=True)
+def temp_dir(tmp_path: Path) -> Path:
+    """Create a temporary directory for tests.
+
+    Backed by pytest's session temp root, which is pruned by pytest itself,
+    so no per-test rmtree is needed.
+    """
+    return tmp_path
+
+
+@pytest.fixture(scope="module")
+def nginx_temp_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Temporary directory shared by a module's nginx generator fixtures."""
+    return tmp_path_factory.mktemp("nginx")
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def base_url(app) -> AsyncGenerator[str]:
+    """Serve the requesting module's ``app`` fixture on an ephemeral port; yields the base URL."""
+    sock, port = tornado.testing.bind_unused_port()
+    server = tornado.httpserver.HTTPServer(app)
+    server.add_sockets([sock])
+    yield f"http://127.0.0.1:{port}"
+    server.stop()
+    await server.close_all_connections()
 
 
 @pytest.fixture
@@ -248,6 +318,41 @@ def reset_tm1_manager():
     TM1ConnectionManager._default_instance = "default"
 
 
+@pytest.fixture(scope="session")
+def sample_token() -> str:
+    """Azure AD-like JWT with full user claims, encoded once per session."""
+    payload = {
+        "oid": "user-object-id-123",
+        "sub": "user-subject-id",
+        "name": "Test User",
+        "preferred_username": "test@company.com",
+        "email": "test@company.com",
+        "given_name": "Test",
+        "family_name": "User",
+        "roles": ["Admin", "Reader"],
+        "groups": ["group-1", "group-2"],
+        "tid": "tenant-id",
+        "azp": "app-id",
+        "iat": datetime.now(UTC),
+        "exp": datetime.now(UTC) + timedelta(hours=1),
+    }
+    return jwt.encode(payload, TEST_JWT_SECRET, algorithm="HS256")
+
+
+@pytest.fixture(scope="session")
+def valid_token() -> str:
+    """Azure AD-like JWT with user identifiers and roles, encoded once per session."""
+    payload = {
+        "oid": "user-123",
+        "sub": "subject-123",
+        "name": "Test User",
+        "preferred_username": "test@example.com",
+        "roles": ["Admin", "Reader"],
+        "exp": datetime.now(UTC) + timedelta(hours=1),
+    }
+    return jwt.encode(payload, TEST_JWT_SECRET, algorithm="HS256")
+
+
 @pytest.fixture
 def reset_auth_config():
     """Reset AuthConfig singleton before test."""
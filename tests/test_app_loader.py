@@ -3,14 +3,11 @@ Tests for the app loader module.
 """
 
 import json
-import sys
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from pyrest.app_loader import AppConfig, AppLoader
 
 
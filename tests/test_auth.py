@@ -3,16 +3,12 @@ Tests for the authentication module.
 """
 
 import json
-import sys
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
-import pytest
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 import jwt
+import pytest
 
 from pyrest.auth import (
     AuthConfig,
@@ -2,16 +2,11 @@
 Tests for Azure AD authentication decorators.
 """
 
-import sys
 from datetime import UTC, datetime, timedelta
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-import pytest
-
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 import jwt
+import pytest
 
 from pyrest.auth import (
     AuthConfig,
@@ -43,26 +38,6 @@ class TestAzureADAuthTokenMethods:
 
             return AzureADAuth()
 
-    @pytest.fixture
-    def sample_token(self):
-        """Create a sample Azure AD-like JWT token."""
-        payload = {
-            "oid": "user-object-id-123",
-            "sub": "user-subject-id",
-            "name": "Test User",
-            "preferred_username": "test@company.com",
-            "email": "test@company.com",
-            "given_name": "Test",
-            "family_name": "User",
-            "roles": ["Admin", "Reader"],
-            "groups": ["group-1", "group-2"],
-            "tid": "tenant-id",
-            "azp": "app-id",
-            "iat": datetime.now(UTC),
-            "exp": datetime.now(UTC) + timedelta(hours=1),
-        }
-        return jwt.encode(payload, TEST_JWT_SECRET, algorithm="HS256")
-
     def test_decode_token_claims(self, azure_auth, sample_token):
         """Should decode token claims without validation."""
         claims = azure_auth.decode_token_claims(sample_token)
@@ -131,19 +106,6 @@ class TestAzureADAuthenticatedDecorator:
         handler._azure_token = None
         return handler
 
-    @pytest.fixture
-    def valid_token(self):
-        """Create valid token with user info."""
-        payload = {
-            "oid": "user-123",
-            "sub": "subject-123",
-            "name": "Test User",
-            "preferred_username": "test@example.com",
-            "roles": ["Admin", "Reader"],
-            "exp": datetime.now(UTC) + timedelta(hours=1),
-        }
-        return jwt.encode(payload, TEST_JWT_SECRET, algorithm="HS256")
-
     @pytest.mark.asyncio
     async def test_valid_token(self, mock_handler, valid_token):
         """Should authenticate with valid token."""
@@ -247,6 +209,24 @@ class TestRequireAzureRolesDecorator:
 
         assert result == "success"
 
+    @pytest.mark.asyncio
+    async def test_role_case_insensitive(self, mock_handler):
+        """Should match roles regardless of casing in the token."""
+        mock_handler._azure_roles = ["reader"]
+
+        @require_azure_roles(["Reader"])
+        async def test_method(self):
+            return "success"
+
+        result = await test_method(mock_handler)
+
+        assert result == "success"
+
+    def test_same_roles_share_decorator(self):
+        """Should reuse the decorator for identical role sets."""
+        assert require_azure_roles(["Admin", "Reader"]) is require_azure_roles(["reader", "Admin"])
+        assert require_azure_roles(["Admin"]) is not require_azure_roles(["Reader"])
+
     @pytest.mark.asyncio
     async def test_no_azure_auth(self):
         """Should deny if not Azure authenticated."""
@@ -279,19 +259,6 @@ class TestRequireAzureRolesDecorator:
 class TestAzureADProtectedDecorator:
     """Tests for @azure_ad_protected combined decorator."""
 
-    @pytest.fixture
-    def valid_token(self):
-        """Create valid token."""
-        payload = {
-            "oid": "user-123",
-            "sub": "subject-123",
-            "name": "Test User",
-            "preferred_username": "test@example.com",
-            "roles": ["Admin", "Reader"],
-            "exp": datetime.now(UTC) + timedelta(hours=1),
-        }
-        return jwt.encode(payload, TEST_JWT_SECRET, algorithm="HS256")
-
     @pytest.mark.asyncio
     async def test_auth_only_no_roles(self, valid_token):
         """Should authenticate without role check when no roles specified."""
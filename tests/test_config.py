@@ -4,11 +4,8 @@ Tests for the configuration module.
 
 import json
 import os
-import sys
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from pyrest.config import EnvConfig, FrameworkConfig
 from tests.conftest import TEST_JWT_SECRET
 
@@ -16,31 +13,29 @@ from tests.conftest import TEST_JWT_SECRET
 class TestEnvConfig:
     """Tests for EnvConfig class."""
 
-    def test_singleton_pattern(self):
+    def test_singleton_pattern(self, monkeypatch):
         """EnvConfig should be a singleton."""
         # Reset singleton for test
-        EnvConfig._instance = None
+        monkeypatch.setattr(EnvConfig, "_instance", None)
 
         config1 = EnvConfig()
         config2 = EnvConfig()
 
         assert config1 is config2
 
-    def test_get_env_variable(self):
+    def test_get_env_variable(self, monkeypatch):
         """Should get environment variables."""
-        EnvConfig._instance = None
+        monkeypatch.setattr(EnvConfig, "_instance", None)
         config = EnvConfig()
 
-        os.environ["TEST_VAR"] = "test_value"
+        monkeypatch.setenv("TEST_VAR", "test_value")
 
         assert config.get("TEST_VAR") == "test_value"
         assert config.get("NONEXISTENT", "default") == "default"
 
-        del os.environ["TEST_VAR"]
-
-    def test_set_env_variable(self):
+    def test_set_env_variable(self, monkeypatch):
         """Should set environment variables."""
-        EnvConfig._instance = None
+        monkeypatch.setattr(EnvConfig, "_instance", None)
         config = EnvConfig()
 
         config.set("CUSTOM_VAR", "custom_value")
@@ -50,10 +45,10 @@ class TestEnvConfig:
 
         del os.environ["CUSTOM_VAR"]
 
-    def test_load_env_file(self, temp_dir: Path):
+    def test_load_env_file(self, temp_dir: Path, monkeypatch):
         """Should load variables from .env file."""
-        EnvConfig._instance = None
-        EnvConfig._env_file_loaded = False
+        monkeypatch.setattr(EnvConfig, "_instance", None)
+        monkeypatch.setattr(EnvConfig, "_env_file_loaded", False)
         config = EnvConfig()
 
         # Create .env file
@@ -65,14 +60,14 @@ class TestEnvConfig:
         assert config.get("TEST_FROM_FILE") == "file_value"
         assert config.get("ANOTHER_VAR") == "another"
 
-    def test_get_prefixed(self):
+    def test_get_prefixed(self, monkeypatch):
         """Should get variables with specific prefix."""
-        EnvConfig._instance = None
+        monkeypatch.setattr(EnvConfig, "_instance", None)
         config = EnvConfig()
 
-        os.environ["PYREST_VAR1"] = "value1"
-        os.environ["PYREST_VAR2"] = "value2"
-        os.environ["OTHER_VAR"] = "other"
+        monkeypatch.setenv("PYREST_VAR1", "value1")
+        monkeypatch.setenv("PYREST_VAR2", "value2")
+        monkeypatch.setenv("OTHER_VAR", "other")
 
         prefixed = config.get_prefixed("PYREST_")
 
@@ -80,17 +75,13 @@ class TestEnvConfig:
         assert "PYREST_VAR2" in prefixed
         assert "OTHER_VAR" not in prefixed
 
-        del os.environ["PYREST_VAR1"]
-        del os.environ["PYREST_VAR2"]
-        del os.environ["OTHER_VAR"]
-
 
 class TestFrameworkConfig:
     """Tests for FrameworkConfig class."""
 
-    def test_default_config(self, temp_dir: Path):
+    def test_default_config(self, temp_dir: Path, monkeypatch):
         """Should use default config when no file exists."""
-        os.chdir(temp_dir)
+        monkeypatch.chdir(temp_dir)
 
         config = FrameworkConfig("nonexistent.json")
 
@@ -119,9 +110,9 @@ class TestFrameworkConfig:
         assert config.debug is True
         assert config.get("custom_option") == "custom_value"
 
-    def test_get_and_set(self, temp_dir: Path):
+    def test_get_and_set(self, temp_dir: Path, monkeypatch):
         """Should get and set configuration values."""
-        os.chdir(temp_dir)
+        monkeypatch.chdir(temp_dir)
         config = FrameworkConfig("nonexistent.json")
 
         config.set("custom_key", "custom_value")
@@ -129,16 +120,16 @@ class TestFrameworkConfig:
         assert config.get("custom_key") == "custom_value"
         assert config.get("nonexistent", "default") == "default"
 
-    def test_jwt_secret_from_env(self, temp_dir: Path, mock_env_vars):
+    def test_jwt_secret_from_env(self, temp_dir: Path, mock_env_vars, monkeypatch):
         """Should prefer PYREST_JWT_SECRET from environment."""
-        os.chdir(temp_dir)
+        monkeypatch.chdir(temp_dir)
 
         # Clear singleton
         from pyrest.config import get_config
 
         get_config.cache_clear()
-        EnvConfig._instance = None
-        EnvConfig._env_file_loaded = False
+        monkeypatch.setattr(EnvConfig, "_instance", None)
+        monkeypatch.setattr(EnvConfig, "_env_file_loaded", False)
 
         config = FrameworkConfig("nonexistent.json")
 
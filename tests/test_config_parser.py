@@ -2,31 +2,43 @@
 Tests for the AppConfigParser class.
 """
 
+import functools
 import json
 import os
-import sys
-from pathlib import Path
+from typing import Any
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
 from pyrest.config import AppConfigParser
+from tests.conftest import json_loads
+
+
+@functools.lru_cache
+def _split_key_path(path: str) -> tuple[str, ...]:
+    return tuple(path.split("."))
+
+
+def deep_get(data: Any, path: str) -> Any:
+    """Walk nested dicts along a dotted key path, e.g. ``"settings.level1.value"``."""
+    for key in _split_key_path(path):
+        data = data[key]
+    return data
 
 
 class TestAppConfigParser:
     """Tests for AppConfigParser class."""
 
-    def setup_method(self):
-        """Clean up environment before each test."""
-        # Remove any test env vars
-        for key in list(os.environ.keys()):
-            if key.startswith("TEST_") or key.startswith("testapp."):
-                del os.environ[key]
+    @pytest.fixture(scope="class")
+    def _environ_snapshot(self) -> set[str]:
+        """Env var names present before any test in the class ran."""
+        return set(os.environ)
 
-    def teardown_method(self):
-        """Clean up environment after each test."""
-        for key in list(os.environ.keys()):
-            if key.startswith("TEST_") or key.startswith("testapp."):
-                del os.environ[key]
+    @pytest.fixture(autouse=True)
+    def _env(self, _environ_snapshot, monkeypatch):
+        """Drop env vars written by AppConfigParser; monkeypatch undoes the rest."""
+        yield
+        for key in os.environ.keys() - _environ_snapshot:
+            del os.environ[key]
 
     def test_basic_config(self):
         """Should parse basic configuration."""
@@ -83,9 +95,9 @@ class TestAppConfigParser:
         assert "testapp.VAR1" in all_vars
         assert "testapp.VAR2" in all_vars
 
-    def test_env_var_resolution_simple(self):
+    def test_env_var_resolution_simple(self, monkeypatch):
         """Should resolve ${VAR} syntax."""
-        os.environ["TEST_VALUE"] = "resolved_value"
+        monkeypatch.setenv("TEST_VALUE", "resolved_value")
 
         config_data = {"settings": {"my_setting": "${TEST_VALUE}"}}
 
@@ -108,9 +120,9 @@ class TestAppConfigParser:
         assert settings["with_default"] == "default_value"
         assert settings["empty_default"] == ""
 
-    def test_env_var_resolution_with_set_var(self):
+    def test_env_var_resolution_with_set_var(self, monkeypatch):
         """Should use env var when set, not default."""
-        os.environ["TEST_OVERRIDE"] = "from_env"
+        monkeypatch.setenv("TEST_OVERRIDE", "from_env")
 
         config_data = {"settings": {"my_setting": "${TEST_OVERRIDE:-default}"}}
 
@@ -118,19 +130,21 @@ class TestAppConfigParser:
 
         assert parser.get("settings")["my_setting"] == "from_env"
 
-    def test_nested_dict_resolution(self):
+    def test_nested_dict_resolution(self, monkeypatch):
         """Should resolve env vars in nested dicts."""
-        os.environ["TEST_NESTED"] = "nested_value"
+        monkeypatch.setenv("TEST_NESTED", "nested_value")
 
         config_data = {"settings": {"level1": {"level2": {"value": "${TEST_NESTED}"}}}}
 
         parser = AppConfigParser("testapp", config_data)
 
-        assert parser.get("settings")["level1"]["level2"]["value"] == "nested_value"
+        assert (
+            deep_get(parser.get_resolved_config(), "settings.level1.level2.value") == "nested_value"
+        )
 
-    def test_list_resolution(self):
+    def test_list_resolution(self, monkeypatch):
         """Should resolve env vars in lists."""
-        os.environ["TEST_LIST_VAL"] = "list_value"
+        monkeypatch.setenv("TEST_LIST_VAL", "list_value")
 
         config_data = {"settings": {"my_list": ["static", "${TEST_LIST_VAL}", "another"]}}
 
@@ -191,20 +205,20 @@ class TestAppConfigParser:
         assert os.environ.get("testapp.tm1.prod.server") == "prod.local"
         assert os.environ.get("testapp.tm1.prod.port") == "8010"
 
-    def test_tm1_instance_env_resolution(self):
+    def test_tm1_instance_env_resolution(self, monkeypatch):
         """Should resolve env vars in TM1 instance config."""
-        os.environ["TEST_TM1_SERVER"] = "resolved-server.local"
+        monkeypatch.setenv("TEST_TM1_SERVER", "resolved-server.local")
 
         config_data = {"tm1_instances": {"prod": {"server": "${TEST_TM1_SERVER}"}}}
 
         parser = AppConfigParser("testapp", config_data)
 
         instances = parser.get_tm1_instances()
-        assert instances["prod"]["server"] == "resolved-server.local"
+        assert deep_get(instances, "prod.server") == "resolved-server.local"
 
-    def test_get_resolved_config(self):
+    def test_get_resolved_config(self, monkeypatch):
         """Should return fully resolved configuration."""
-        os.environ["TEST_RESOLVED"] = "resolved"
+        monkeypatch.setenv("TEST_RESOLVED", "resolved")
 
         config_data = {
             "name": "testapp",
@@ -217,7 +231,7 @@ class TestAppConfigParser:
         resolved = parser.get_resolved_config()
 
         assert resolved["name"] == "testapp"
-        assert resolved["settings"]["value"] == "resolved"
+        assert deep_get(resolved, "settings.value") == "resolved"
         assert "os_vars" not in resolved  # os_vars is handled specially
 
     def test_to_env_dict(self):
@@ -261,8 +275,8 @@ class TestAppConfigParser:
 
         # Lists and dicts should be JSON-encoded
         assert os.environ.get("testapp.SIMPLE") == "value"
-        assert json.loads(os.environ.get("testapp.LIST_VAR")) == ["a", "b", "c"]
-        assert json.loads(os.environ.get("testapp.DICT_VAR")) == {"key": "value"}
+        assert json_loads(os.environ.get("testapp.LIST_VAR")) == ["a", "b", "c"]
+        assert json_loads(os.environ.get("testapp.DICT_VAR")) == {"key": "value"}
 
     def test_boolean_in_tm1_instances(self):
         """Should handle boolean values in TM1 instances."""
@@ -2,14 +2,10 @@
 Tests for the decorators module.
 """
 
-import sys
-from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from pyrest.decorators import (
     RestHandler,
     create_handler,
@@ -31,6 +27,10 @@ def _make_mock_request():
     return request
 
 
+async def _noop(handler):
+    """Shared no-op handler callback for CRUD tests."""
+
+
 class TestRouteDecorators:
     """Tests for HTTP method decorators."""
 
@@ -51,11 +51,9 @@ class TestRouteDecorators:
             async def list_items(self):
                 return "items"
 
-        handler = TestHandler(MagicMock(), _make_mock_request())
-
-        assert hasattr(handler.list_items, "_route_info")
-        assert handler.list_items._route_info[0]["method"] == "GET"
-        assert handler.list_items._route_info[0]["path"] == "/items"
+        assert hasattr(TestHandler.list_items, "_route_info")
+        assert TestHandler.list_items._route_info[0]["method"] == "GET"
+        assert TestHandler.list_items._route_info[0]["path"] == "/items"
 
     def test_post_decorator(self):
         """Should mark method as POST handler."""
@@ -65,10 +63,8 @@ class TestRouteDecorators:
             async def create_item(self):
                 return "created"
 
-        handler = TestHandler(MagicMock(), _make_mock_request())
-
-        assert hasattr(handler.create_item, "_route_info")
-        assert handler.create_item._route_info[0]["method"] == "POST"
+        assert hasattr(TestHandler.create_item, "_route_info")
+        assert TestHandler.create_item._route_info[0]["method"] == "POST"
 
     def test_put_decorator(self):
         """Should mark method as PUT handler."""
@@ -79,9 +75,7 @@ class TestRouteDecorators:
                 # For testing purposes
                 pass
 
-        handler = TestHandler(MagicMock(), _make_mock_request())
-
-        assert handler.update_item._route_info[0]["method"] == "PUT"
+        assert TestHandler.update_item._route_info[0]["method"] == "PUT"
 
     def test_delete_decorator(self):
         """Should mark method as DELETE handler."""
@@ -92,9 +86,7 @@ class TestRouteDecorators:
                 # For testing purposes
                 pass
 
-        handler = TestHandler(MagicMock(), _make_mock_request())
-
-        assert handler.delete_item._route_info[0]["method"] == "DELETE"
+        assert TestHandler.delete_item._route_info[0]["method"] == "DELETE"
 
     def test_multiple_decorators(self):
         """Should handle multiple method decorators."""
@@ -106,9 +98,7 @@ class TestRouteDecorators:
                 # For testing purposes
                 pass
 
-        handler = TestHandler(MagicMock(), _make_mock_request())
-
-        assert len(handler.list_items._route_info) == 2
+        assert len(TestHandler.list_items._route_info) == 2
 
 
 class TestRestHandler:
@@ -146,13 +136,13 @@ class TestRestHandler:
 
         assert result == 10
 
-    def test_get_bool_param_true(self, mock_request):
+    @pytest.mark.parametrize("true_value", ["true", "1", "yes", "on", "TRUE", "Yes"])
+    def test_get_bool_param_true(self, mock_request, true_value):
         """Should parse boolean true values."""
         handler = RestHandler(MagicMock(), mock_request)
+        handler.get_argument = lambda *args, **kwargs: true_value
 
-        for true_value in ["true", "1", "yes", "on", "TRUE", "Yes"]:
-            handler.get_argument = MagicMock(return_value=true_value)
-            assert handler.get_bool_param("flag") is True
+        assert handler.get_bool_param("flag") is True
 
     def test_get_bool_param_false(self, mock_request):
         """Should parse boolean false values."""
@@ -235,32 +225,23 @@ class TestCreateHandler:
 class TestCrudHandlers:
     """Tests for crud_handlers function."""
 
-    def test_crud_handlers_all(self):
-        """Should create all CRUD handlers."""
-
-        async def list_fn(handler):
-            pass
-
-        async def get_fn(handler):
-            pass
-
-        async def create_fn(handler):  # For testing purposes
-            pass
-
-        async def update_fn(handler):  # For testing purposes
-            pass
-
-        async def delete_fn(handler):  # For testing purposes
-            pass
-
-        handlers = crud_handlers(
-            "users",
-            list_func=list_fn,
-            get_func=get_fn,
-            create_func=create_fn,
-            update_func=update_fn,
-            delete_func=delete_fn,
-        )
+    @pytest.mark.parametrize(
+        "funcs",
+        [
+            {
+                "list_func": _noop,
+                "get_func": _noop,
+                "create_func": _noop,
+                "update_func": _noop,
+                "delete_func": _noop,
+            },
+            {"list_func": _noop, "get_func": _noop},
+        ],
+        ids=["all", "partial"],
+    )
+    def test_crud_handlers(self, funcs):
+        """Should create collection and item handlers for the given operations."""
+        handlers = crud_handlers("users", **funcs)
 
         assert len(handlers) == 2  # Collection and item handlers
 
@@ -269,26 +250,9 @@ class TestCrudHandlers:
         assert "/" in paths
         assert any("id" in p for p in paths)
 
-    def test_crud_handlers_partial(self):
-        """Should handle partial CRUD operations."""
-
-        async def list_fn(handler):
-            pass
-
-        async def get_fn(handler):
-            pass
-
-        handlers = crud_handlers("items", list_func=list_fn, get_func=get_fn)
-
-        assert len(handlers) == 2
-
     def test_crud_handlers_custom_id(self):
         """Should use custom ID parameter name."""
-
-        async def get_fn(handler):
-            pass
-
-        handlers = crud_handlers("posts", get_func=get_fn, id_param="post_id")
+        handlers = crud_handlers("posts", get_func=_noop, id_param="post_id")
 
         item_path = handlers[0][0]
         assert "post_id" in item_path
@@ -2,15 +2,12 @@
 Tests for the handlers module.
 """
 
-import json
-import sys
-from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-import tornado.testing
+import pytest
 import tornado.web
+from tornado.httpclient import AsyncHTTPClient
 
 from pyrest.handlers import (
     BASE_PATH,
@@ -18,6 +15,14 @@ from pyrest.handlers import (
     HealthHandler,
     get_auth_handlers,
 )
+from tests.conftest import json_loads
+
+
+def _stub(body: bytes = b"") -> SimpleNamespace:
+    """Minimal stand-in for a handler: only the attributes BaseHandler helpers touch."""
+    return SimpleNamespace(
+        request=SimpleNamespace(body=body), set_status=MagicMock(), write=MagicMock()
+    )
 
 
 class TestBaseHandler:
@@ -29,8 +34,7 @@ class TestBaseHandler:
 
     def test_get_json_body_valid(self):
         """Should parse valid JSON body."""
-        mock_handler = MagicMock()
-        mock_handler.request.body = b'{"key": "value"}'
+        mock_handler = _stub(b'{"key": "value"}')
 
         result = BaseHandler.get_json_body(mock_handler)
 
@@ -38,8 +42,7 @@ class TestBaseHandler:
 
     def test_get_json_body_invalid(self):
         """Should return empty dict for invalid JSON."""
-        mock_handler = MagicMock()
-        mock_handler.request.body = b"not valid json"
+        mock_handler = _stub(b"not valid json")
 
         result = BaseHandler.get_json_body(mock_handler)
 
@@ -47,9 +50,7 @@ class TestBaseHandler:
 
     def test_success_response(self):
         """Should format success response correctly."""
-        mock_handler = MagicMock(spec=BaseHandler)
-        mock_handler.set_status = MagicMock()
-        mock_handler.write = MagicMock()
+        mock_handler = _stub()
 
         BaseHandler.success(mock_handler, data={"foo": "bar"}, message="OK")
 
@@ -61,9 +62,7 @@ class TestBaseHandler:
 
     def test_error_response(self):
         """Should format error response correctly."""
-        mock_handler = MagicMock(spec=BaseHandler)
-        mock_handler.set_status = MagicMock()
-        mock_handler.write = MagicMock()
+        mock_handler = _stub()
 
         BaseHandler.error(mock_handler, message="Something went wrong", status_code=400)
 
@@ -76,23 +75,25 @@ class TestBaseHandler:
 class TestAuthHandlers:
     """Tests for authentication handlers."""
 
-    def test_get_auth_handlers_returns_list(self):
-        """Should return list of handler tuples."""
-        handlers = get_auth_handlers()
+    @pytest.fixture(scope="class")
+    def auth_handlers(self):
+        """Auth handler table, built once for the class."""
+        return get_auth_handlers()
 
-        assert isinstance(handlers, list)
-        assert len(handlers) > 0
+    def test_get_auth_handlers_returns_list(self, auth_handlers):
+        """Should return list of handler tuples."""
+        assert isinstance(auth_handlers, list)
+        assert len(auth_handlers) > 0
 
         # Check format
-        for handler in handlers:
+        for handler in auth_handlers:
             assert len(handler) >= 2
             assert isinstance(handler[0], str)
             assert handler[0].startswith("/pyrest")
 
-    def test_auth_handlers_paths(self):
+    def test_auth_handlers_paths(self, auth_handlers):
         """Should include all auth paths."""
-        handlers = get_auth_handlers()
-        paths = [h[0] for h in handlers]
+        paths = {h[0] for h in auth_handlers}
 
         # Paths use /? suffix for optional trailing slash support
         assert "/pyrest/auth/login/?" in paths
@@ -104,22 +105,22 @@ class TestAuthHandlers:
         assert "/pyrest/health/?" in paths
 
 
-class TestHandlersIntegration(tornado.testing.AsyncHTTPTestCase):
-    """Integration tests for handlers using Tornado test client."""
+@pytest.fixture(scope="module")
+def app():
+    """Application with just HealthHandler; conftest's base_url serves it."""
+    return tornado.web.Application([(r"/pyrest/health", HealthHandler)])
+
 
-    def get_app(self):
-        """Create test application."""
-        handlers = [
-            (r"/pyrest/health", HealthHandler),
-        ]
-        return tornado.web.Application(handlers)
+@pytest.mark.asyncio(loop_scope="module")
+class TestHandlersIntegration:
+    """Integration tests for handlers against a shared Tornado server."""
 
-    def test_health_endpoint(self):
+    async def test_health_endpoint(self, base_url):
         """Health endpoint should return healthy status."""
-        response = self.fetch("/pyrest/health")
+        response = await AsyncHTTPClient().fetch(f"{base_url}/pyrest/health")
 
         assert response.code == 200
 
-        data = json.loads(response.body)
+        data = json_loads(response.body)
         assert data["success"] is True
         assert data["data"]["status"] == "healthy"
@@ -2,63 +2,123 @@
 Integration tests for the PyRest framework.
 """
 
+import copy
 import json
-import os
-import sys
-from pathlib import Path
-from unittest.mock import patch
+from types import SimpleNamespace
+from unittest.mock import create_autospec
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-import tornado.testing
-import tornado.web
+import pytest
+from tornado.httpclient import AsyncHTTPClient
 
+import pyrest.auth
+from pyrest.app_loader import AppLoader
 from pyrest.handlers import BASE_PATH
 from pyrest.server import create_app
-from pyrest.server import create_app
-from tests.conftest import TEST_JWT_SECRET
+from tests.conftest import TEST_JWT_SECRET, json_dumps, json_loads
 
 TEST_PASSWORD = "testpass"  # NOSONAR
 ADMIN_PASSWORD = "adminpass"  # NOSONAR
 FLOW_PASSWORD = "flowpass"  # NOSONAR
 WRONG_PASSWORD = "wrong"  # NOSONAR
 
-
-class TestServerIntegration(tornado.testing.AsyncHTTPTestCase):
+# Endpoint URLs, formatted once
+_URL_ROOT = f"{BASE_PATH}/"
+_URL_HEALTH = f"{BASE_PATH}/health"
+_URL_APPS = f"{BASE_PATH}/apps"
+_URL_STATUS = f"{BASE_PATH}/status"
+_URL_UNKNOWN = f"{BASE_PATH}/unknown/path"
+_URL_REGISTER = f"{BASE_PATH}/auth/register"
+_URL_LOGIN = f"{BASE_PATH}/auth/login"
+_URL_ME = f"{BASE_PATH}/auth/me"
+_URL_AZURE_LOGIN = f"{BASE_PATH}/auth/azure/login"
+
+# Static request bodies, serialized once
+_REGISTER_BODY = json_dumps(
+    {"username": "testuser", "password": TEST_PASSWORD, "email": "test@example.com"}
+)
+_REGISTER_MISSING_FIELDS_BODY = json_dumps({"username": "testuser"})
+_BAD_LOGIN_BODY = json_dumps({"username": "nonexistent", "password": WRONG_PASSWORD})
+_FLOW_USER_BODY = json_dumps({"username": "flowuser", "password": FLOW_PASSWORD})
+
+
+# Templates built once at import; the app fixture installs shallow copies via monkeypatch
+_CONFIG_TEMPLATE = SimpleNamespace(
+    debug=True,
+    apps_folder="test_apps",
+    jwt_secret=TEST_JWT_SECRET,
+    isolated_app_base_port=9001,
+    port=8000,
+    base_path="/pyrest",
+    auth_config_file="auth_config.json",
+    get=lambda *args, **kwargs: None,
+)
+
+_AUTH_CONFIG_TEMPLATE = SimpleNamespace(
+    jwt_secret=TEST_JWT_SECRET,
+    jwt_expiry_hours=24,
+    jwt_algorithm="HS256",
+    tenant_id="",
+    client_id="",
+    client_secret="",
+    is_configured=False,
+)
+
+_LOADER_TEMPLATE = create_autospec(AppLoader, instance=True)
+_LOADER_TEMPLATE.load_all_apps.return_value = []
+_LOADER_TEMPLATE.loaded_apps = {}
+_LOADER_TEMPLATE.isolated_apps = {}
+_LOADER_TEMPLATE.get_embedded_apps.return_value = []
+_LOADER_TEMPLATE.get_isolated_apps.return_value = []
+_LOADER_TEMPLATE.get_loaded_apps_info.return_value = []
+
+
+@pytest.fixture(scope="module")
+def app():
+    """Create the test application once per module with mocked config."""
+    config = copy.copy(_CONFIG_TEMPLATE)
+    auth_config = copy.copy(_AUTH_CONFIG_TEMPLATE)
+    loader = copy.copy(_LOADER_TEMPLATE)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("pyrest.server.get_config", lambda: config)
+        mp.setattr("pyrest.server.get_env", lambda: None)
+        mp.setattr("pyrest.server.AppLoader", lambda *args, **kwargs: loader)
+        mp.setattr("pyrest.auth.get_auth_config", lambda: auth_config)
+
+        return create_app()
+
+
+@pytest.fixture(scope="class")
+def admin_token():
+    """Seed a bootstrap admin once per class and return its JWT.
+
+    The token only has to verify against the session's test secret, so it
+    stays valid across the fresh auth managers each test gets.
+    """
+    mgr = pyrest.auth.AuthManager()
+    mgr.register_user("admin", ADMIN_PASSWORD)
+    return mgr.authenticate_user("admin", ADMIN_PASSWORD)
+
+
+async def fetch(base_url: str, path: str, **kwargs):
+    """Fetch ``path`` over a real socket like ``AsyncHTTPTestCase.fetch`` would."""
+    kwargs.setdefault("follow_redirects", False)
+    return await AsyncHTTPClient().fetch(f"{base_url}{path}", raise_error=False, **kwargs)
+
+
+@pytest.mark.asyncio(loop_scope="module")
+class TestServerIntegration:
     """Integration tests for the PyRest server."""
 
-    def get_app(self):
-        """Create test application with mocked config."""
-        with patch("pyrest.server.get_config") as mock_config:
-            mock_config.return_value.debug = True
-            mock_config.return_value.apps_folder = "test_apps"
-            mock_config.return_value.jwt_secret = TEST_JWT_SECRET
-            mock_config.return_value.isolated_app_base_port = 9001
-            mock_config.return_value.port = 8000
-            mock_config.return_value.base_path = "/pyrest"
-            mock_config.return_value.auth_config_file = "auth_config.json"
-            mock_config.return_value.get.return_value = None
-
-            with patch("pyrest.server.get_env"):
-                with patch("pyrest.server.AppLoader") as mock_loader:
-                    mock_loader.return_value.load_all_apps.return_value = []
-                    mock_loader.return_value.loaded_apps = {}
-                    mock_loader.return_value.isolated_apps = {}
-                    mock_loader.return_value.get_embedded_apps.return_value = []
-                    mock_loader.return_value.get_isolated_apps.return_value = []
-                    mock_loader.return_value.get_loaded_apps_info.return_value = []
-
-                    return create_app()
-
-    def test_root_endpoint(self):
+    async def test_root_endpoint(self, base_url):
         """Root endpoint should return API info (HTML template or JSON fallback)."""
-        response = self.fetch(f"{BASE_PATH}/")
+        response = await fetch(base_url, _URL_ROOT)
 
         assert response.code == 200
 
         body = response.body.decode("utf-8")
         try:
-            data = json.loads(body)
+            data = json_loads(body)
             # JSON fallback when no template is available
             assert data["success"] is True
             assert "PyRest" in data["data"]["name"]
@@ -67,257 +127,153 @@ class TestServerIntegration(tornado.testing.AsyncHTTPTestCase):
             # HTML template rendered successfully
             assert "PyRest" in body
 
-    def test_health_endpoint(self):
+    async def test_health_endpoint(self, base_url):
         """Health endpoint should return healthy status."""
-        response = self.fetch(f"{BASE_PATH}/health")
+        response = await fetch(base_url, _URL_HEALTH)
 
         assert response.code == 200
 
-        data = json.loads(response.body)
+        data = json_loads(response.body)
         assert data["data"]["status"] == "healthy"
 
-    def test_apps_endpoint(self):
+    async def test_apps_endpoint(self, base_url):
         """Apps endpoint should list apps."""
-        response = self.fetch(f"{BASE_PATH}/apps")
+        response = await fetch(base_url, _URL_APPS)
 
         assert response.code == 200
 
-        data = json.loads(response.body)
+        data = json_loads(response.body)
         assert "apps" in data["data"]
 
-    def test_status_endpoint(self):
+    async def test_status_endpoint(self, base_url):
         """Status endpoint should return system status."""
-        response = self.fetch(f"{BASE_PATH}/status")
+        response = await fetch(base_url, _URL_STATUS)
 
         assert response.code == 200
 
-        data = json.loads(response.body)
+        data = json_loads(response.body)
         assert "framework" in data["data"]
         assert "embedded_apps" in data["data"]
         assert "isolated_apps" in data["data"]
 
-    def test_cors_headers_not_sent_by_default(self):
+    async def test_cors_headers_not_sent_by_default(self, base_url):
         """CORS headers should NOT be sent when cors_origins is empty (S5122)."""
-        response = self.fetch(f"{BASE_PATH}/health")
+        response = await fetch(base_url, _URL_HEALTH)
 
         # Default cors_origins is now [] — no CORS headers should be set
         assert "Access-Control-Allow-Origin" not in response.headers
 
-    def test_options_request(self):
+    async def test_options_request(self, base_url):
         """Should handle CORS preflight requests."""
-        response = self.fetch(
-            f"{BASE_PATH}/health", method="OPTIONS", allow_nonstandard_methods=True
+        response = await fetch(
+            base_url, _URL_HEALTH, method="OPTIONS", allow_nonstandard_methods=True
         )
 
         assert response.code == 204
 
-    def test_404_for_unknown_path(self):
+    async def test_404_for_unknown_path(self, base_url):
         """Should return 404 for unknown paths."""
-        response = self.fetch(f"{BASE_PATH}/unknown/path")
+        response = await fetch(base_url, _URL_UNKNOWN)
 
         assert response.code == 404
 
 
-class TestAuthIntegration(tornado.testing.AsyncHTTPTestCase):
+@pytest.mark.asyncio(loop_scope="module")
+class TestAuthIntegration:
     """Integration tests for authentication endpoints."""
 
-    def setUp(self):
-        self._orig_jwt = os.environ.get("PYREST_JWT_SECRET")
-        os.environ["PYREST_JWT_SECRET"] = TEST_JWT_SECRET
-        import pyrest.auth as _auth_mod
-
-        _auth_mod._auth_manager = None
-        if hasattr(_auth_mod, "AuthConfig"):
-            _auth_mod.AuthConfig._instance = None
-        super().setUp()
-
-    def tearDown(self):
-        super().tearDown()
-        if self._orig_jwt is not None:
-            os.environ["PYREST_JWT_SECRET"] = self._orig_jwt
-        else:
-            os.environ.pop("PYREST_JWT_SECRET", None)
-
-    def get_app(self):
-        """Create test application."""
-        with patch("pyrest.server.get_config") as mock_config:
-            mock_config.return_value.debug = True
-            mock_config.return_value.apps_folder = "test_apps"
-            mock_config.return_value.jwt_secret = TEST_JWT_SECRET
-            mock_config.return_value.isolated_app_base_port = 9001
-            mock_config.return_value.port = 8000
-            mock_config.return_value.base_path = "/pyrest"
-            mock_config.return_value.auth_config_file = "auth_config.json"
-            mock_config.return_value.get.return_value = None
-
-            with patch("pyrest.server.get_env"):
-                with patch("pyrest.server.AppLoader") as mock_loader:
-                    mock_loader.return_value.load_all_apps.return_value = []
-                    mock_loader.return_value.loaded_apps = {}
-                    mock_loader.return_value.isolated_apps = {}
-                    mock_loader.return_value.get_embedded_apps.return_value = []
-                    mock_loader.return_value.get_isolated_apps.return_value = []
-
-                    with patch("pyrest.auth.get_auth_config") as mock_auth:
-                        mock_auth.return_value.jwt_secret = TEST_JWT_SECRET
-                        mock_auth.return_value.jwt_expiry_hours = 24
-                        mock_auth.return_value.jwt_algorithm = "HS256"
-                        mock_auth.return_value.tenant_id = ""
-                        mock_auth.return_value.client_id = ""
-                        mock_auth.return_value.client_secret = ""
-                        mock_auth.return_value.is_configured = False
-
-                        return create_app()
-
-    def _get_admin_token(self) -> str:
-        """Seed a bootstrap admin user and return a JWT token."""
-        from pyrest.auth import get_auth_manager
-
-        mgr = get_auth_manager()
-        mgr.register_user("admin", ADMIN_PASSWORD)
-        token = mgr.authenticate_user("admin", ADMIN_PASSWORD)
-        return token
-
-    def test_register_requires_auth(self):
+    async def test_register_requires_auth(self, base_url):
         """Registration should require a valid JWT (S4834)."""
-        response = self.fetch(
-            f"{BASE_PATH}/auth/register",
+        response = await fetch(
+            base_url,
+            _URL_REGISTER,
             method="POST",
-            body=json.dumps(
-                {"username": "testuser", "password": TEST_PASSWORD, "email": "test@example.com"}
-            ),
+            body=_REGISTER_BODY,
             headers={"Content-Type": "application/json"},
         )
 
         assert response.code == 401
 
-    def test_register_user_with_auth(self):
+    async def test_register_user_with_auth(self, base_url, admin_token):
         """Should register new user when caller has valid JWT."""
-        token = self._get_admin_token()
-
-        response = self.fetch(
-            f"{BASE_PATH}/auth/register",
+        response = await fetch(
+            base_url,
+            _URL_REGISTER,
             method="POST",
-            body=json.dumps(
-                {"username": "testuser", "password": TEST_PASSWORD, "email": "test@example.com"}  
-            ),
+            body=_REGISTER_BODY,
             headers={
                 "Content-Type": "application/json",
-                "Authorization": f"Bearer {token}",
+                "Authorization": f"Bearer {admin_token}",
             },
         )
 
         assert response.code == 201
 
-        data = json.loads(response.body)
+        data = json_loads(response.body)
         assert data["success"] is True
         assert data["data"]["username"] == "testuser"
 
-    def test_register_missing_fields_with_auth(self):
+    async def test_register_missing_fields_with_auth(self, base_url, admin_token):
         """Should reject registration with missing fields (even with valid JWT)."""
-        token = self._get_admin_token()
-
-        response = self.fetch(
-            f"{BASE_PATH}/auth/register",
+        response = await fetch(
+            base_url,
+            _URL_REGISTER,
             method="POST",
-            body=json.dumps({"username": "testuser"}),
+            body=_REGISTER_MISSING_FIELDS_BODY,
             headers={
                 "Content-Type": "application/json",
-                "Authorization": f"Bearer {token}",
+                "Authorization": f"Bearer {admin_token}",
             },
         )
 
         assert response.code == 400
 
-    def test_login_invalid_credentials(self):
+    async def test_login_invalid_credentials(self, base_url):
         """Should reject invalid credentials."""
-        response = self.fetch(
-            f"{BASE_PATH}/auth/login",
+        response = await fetch(
+            base_url,
+            _URL_LOGIN,
             method="POST",
-            body=json.dumps({"username": "nonexistent", "password": WRONG_PASSWORD}),
+            body=_BAD_LOGIN_BODY,
             headers={"Content-Type": "application/json"},
         )
 
         assert response.code == 401
 
-    def test_auth_me_without_token(self):
+    async def test_auth_me_without_token(self, base_url):
         """Should reject /auth/me without token."""
-        response = self.fetch(f"{BASE_PATH}/auth/me")
+        response = await fetch(base_url, _URL_ME)
 
         assert response.code == 401
 
-    def test_azure_login_not_configured(self):
+    async def test_azure_login_not_configured(self, base_url, tmp_path, monkeypatch):
         """Should return error if Azure AD not configured."""
-        response = self.fetch(f"{BASE_PATH}/auth/azure/login")
+        # Keep the repo's sample auth_config.json and any AZURE_AD_* vars out of
+        # play; otherwise the handler redirects to the Azure login endpoint.
+        monkeypatch.chdir(tmp_path)
+        for var in ("AZURE_AD_TENANT_ID", "AZURE_AD_CLIENT_ID", "AZURE_AD_CLIENT_SECRET"):
+            monkeypatch.delenv(var, raising=False)
+
+        response = await fetch(base_url, _URL_AZURE_LOGIN)
 
         # Should return error since Azure AD is not configured
         assert response.code == 500
 
 
-class TestFullWorkflow(tornado.testing.AsyncHTTPTestCase):
+@pytest.mark.asyncio(loop_scope="module")
+class TestFullWorkflow:
     """End-to-end workflow tests."""
 
-    def setUp(self):
-        # Ensure JWT secret is set for the full test lifecycle (not just get_app)
-        self._orig_jwt = os.environ.get("PYREST_JWT_SECRET")
-        os.environ["PYREST_JWT_SECRET"] = TEST_JWT_SECRET
-        # Reset auth singletons so they pick up the env var
-        import pyrest.auth as _auth_mod
-
-        _auth_mod._auth_manager = None
-        if hasattr(_auth_mod, "AuthConfig"):
-            _auth_mod.AuthConfig._instance = None
-        super().setUp()
-
-    def tearDown(self):
-        super().tearDown()
-        if self._orig_jwt is not None:
-            os.environ["PYREST_JWT_SECRET"] = self._orig_jwt
-        else:
-            os.environ.pop("PYREST_JWT_SECRET", None)
-
-    def get_app(self):
-        """Create test application."""
-        with patch("pyrest.server.get_config") as mock_config:
-            mock_config.return_value.debug = True
-            mock_config.return_value.apps_folder = "test_apps"
-            mock_config.return_value.jwt_secret = TEST_JWT_SECRET
-            mock_config.return_value.isolated_app_base_port = 9001
-            mock_config.return_value.port = 8000
-            mock_config.return_value.base_path = "/pyrest"
-            mock_config.return_value.auth_config_file = "auth_config.json"
-            mock_config.return_value.get.return_value = None
-
-            with patch("pyrest.server.get_env"):
-                with patch("pyrest.server.AppLoader") as mock_loader:
-                    mock_loader.return_value.load_all_apps.return_value = []
-                    mock_loader.return_value.loaded_apps = {}
-                    mock_loader.return_value.isolated_apps = {}
-                    mock_loader.return_value.get_embedded_apps.return_value = []
-                    mock_loader.return_value.get_isolated_apps.return_value = []
-
-                    with patch("pyrest.auth.get_auth_config") as mock_auth:
-                        mock_auth.return_value.jwt_secret = TEST_JWT_SECRET
-                        mock_auth.return_value.jwt_expiry_hours = 24
-                        mock_auth.return_value.jwt_algorithm = "HS256"
-                        mock_auth.return_value.is_configured = False
-
-                        return create_app()
-
-    def test_register_login_access_flow(self):
+    async def test_register_login_access_flow(self, base_url, admin_token):
         """Test complete user flow: bootstrap admin -> register user -> login -> access protected."""
-        from pyrest.auth import get_auth_manager
-
-        # 0. Seed a bootstrap admin directly (simulates initial setup / CLI provisioning)
-        mgr = get_auth_manager()
-        mgr.register_user("admin", ADMIN_PASSWORD)
-        admin_token = mgr.authenticate_user("admin", ADMIN_PASSWORD)
+        # 0. The admin_token fixture seeds a bootstrap admin (simulates CLI provisioning)
 
         # 1. Register a new user via the API (now requires auth)
-        register_response = self.fetch(
-            f"{BASE_PATH}/auth/register",
+        register_response = await fetch(
+            base_url,
+            _URL_REGISTER,
             method="POST",
-            body=json.dumps({"username": "flowuser", "password": FLOW_PASSWORD}),
+            body=_FLOW_USER_BODY,
             headers={
                 "Content-Type": "application/json",
                 "Authorization": f"Bearer {admin_token}",
@@ -326,22 +282,21 @@ class TestFullWorkflow(tornado.testing.AsyncHTTPTestCase):
         assert register_response.code == 201
 
         # 2. Login as the new user
-        login_response = self.fetch(
-            f"{BASE_PATH}/auth/login",
+        login_response = await fetch(
+            base_url,
+            _URL_LOGIN,
             method="POST",
-            body=json.dumps({"username": "flowuser", "password": FLOW_PASSWORD}),
+            body=_FLOW_USER_BODY,
             headers={"Content-Type": "application/json"},
         )
         assert login_response.code == 200
 
-        login_data = json.loads(login_response.body)
+        login_data = json_loads(login_response.body)
         token = login_data["data"]["access_token"]
 
         # 3. Access protected endpoint
-        me_response = self.fetch(
-            f"{BASE_PATH}/auth/me", headers={"Authorization": f"Bearer {token}"}
-        )
+        me_response = await fetch(base_url, _URL_ME, headers={"Authorization": f"Bearer {token}"})
         assert me_response.code == 200
 
-        me_data = json.loads(me_response.body)
+        me_data = json_loads(me_response.body)
         assert me_data["data"]["sub"] == "flowuser"
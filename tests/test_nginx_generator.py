@@ -2,45 +2,68 @@
 Tests for the nginx configuration generator module.
 """
 
-import sys
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from pyrest.app_loader import AppConfig
 from pyrest.nginx_generator import NginxGenerator, get_nginx_generator
 
+# Substrings the rendered config and routing summary must contain
+_FULL_CONFIG_TOKENS = (
+    # Header
+    "PyRest Nginx Configuration",
+    # Upstreams
+    "upstream pyrest_main",
+    "127.0.0.1:8000",
+    "upstream pyrest_tm1data",
+    "127.0.0.1:8001",
+    # Server block
+    "server {",
+    "listen 80",
+    # Locations
+    "location ~ ^/pyrest/tm1data",
+    "location /pyrest/",
+    # Health endpoint
+    "location /nginx-health",
+)
+
+_SUMMARY_TOKENS = ("Embedded Apps", "hello", "Isolated Apps", "tm1data", "port 8001")
+
+
+def missing_tokens(text: str, tokens: tuple[str, ...]) -> list[str]:
+    """Return the tokens not found in text, so one assert reports every miss."""
+    return [token for token in tokens if token not in text]
+
 
 class TestNginxGenerator:
     """Tests for NginxGenerator class."""
 
-    @pytest.fixture
-    def nginx_generator(self, temp_dir: Path):
-        """Create NginxGenerator with temp output dir."""
+    @pytest.fixture(scope="module")
+    def nginx_generator(self, nginx_temp_dir: Path):
+        """Create one NginxGenerator (non-Docker) writing under the module temp dir."""
         with patch("pyrest.nginx_generator.get_config") as mock_config:
             mock_config.return_value.port = 8000
             mock_config.return_value.base_path = "/pyrest"
 
-            return NginxGenerator(str(temp_dir / "nginx"))
+            return NginxGenerator(str(nginx_temp_dir / "nginx"), docker_mode=False)
 
-    @pytest.fixture
-    def sample_embedded_apps(self, temp_dir: Path):
+    @pytest.fixture(scope="module")
+    def sample_embedded_apps(self, nginx_temp_dir: Path):
         """Create sample embedded app configs."""
-        app_path = temp_dir / "hello"
-        app_path.mkdir(parents=True)
+        app_path = nginx_temp_dir / "hello"
+        app_path.mkdir()
 
         return [
             AppConfig(app_path, {"name": "hello", "prefix": "/hello"}),
         ]
 
-    @pytest.fixture
-    def sample_isolated_apps(self, temp_dir: Path):
+    @pytest.fixture(scope="module")
+    def sample_isolated_apps(self, nginx_temp_dir: Path):
         """Create sample isolated app configs."""
-        app_path = temp_dir / "tm1data"
-        app_path.mkdir(parents=True)
+        app_path = nginx_temp_dir / "tm1data"
+        app_path.mkdir()
         (app_path / "requirements.txt").write_text("tm1py")
 
         config = AppConfig(app_path, {"name": "tm1data", "prefix": "/tm1data", "port": 8001})
@@ -48,9 +71,9 @@ class TestNginxGenerator:
 
         return [config]
 
-    def test_output_dir_creation(self, temp_dir: Path):
+    def test_output_dir_creation(self, tmp_path: Path):
         """Should create output directory if not exists."""
-        output_dir = temp_dir / "new_nginx_dir"
+        output_dir = tmp_path / "new_nginx_dir"
 
         with patch("pyrest.nginx_generator.get_config") as mock_config:
             mock_config.return_value.port = 8000
@@ -60,17 +83,6 @@ class TestNginxGenerator:
 
             assert output_dir.exists()
 
-    def test_generate_upstream_config(self, nginx_generator, sample_isolated_apps):
-        """Should generate upstream blocks."""
-        config = nginx_generator.generate_upstream_config(
-            main_port=8000, isolated_apps=sample_isolated_apps
-        )
-
-        assert "upstream pyrest_main" in config
-        assert "127.0.0.1:8000" in config
-        assert "upstream pyrest_tm1data" in config
-        assert "127.0.0.1:8001" in config
-
     def test_generate_location_config(
         self, nginx_generator, sample_embedded_apps, sample_isolated_apps
     ):
@@ -89,28 +101,12 @@ class TestNginxGenerator:
     def test_generate_full_config(
         self, nginx_generator, sample_embedded_apps, sample_isolated_apps
     ):
-        """Should generate complete nginx configuration."""
+        """Should generate complete nginx configuration, upstreams included."""
         config = nginx_generator.generate_full_config(
             main_port=8000, embedded_apps=sample_embedded_apps, isolated_apps=sample_isolated_apps
         )
 
-        # Check header
-        assert "PyRest Nginx Configuration" in config
-
-        # Check upstreams
-        assert "upstream pyrest_main" in config
-        assert "upstream pyrest_tm1data" in config
-
-        # Check server block
-        assert "server {" in config
-        assert "listen 80" in config
-
-        # Check locations
-        assert "location ~ ^/pyrest/tm1data" in config
-        assert "location /pyrest/" in config
-
-        # Check health endpoint
-        assert "location /nginx-health" in config
+        assert missing_tokens(config, _FULL_CONFIG_TOKENS) == []
 
     @pytest.mark.asyncio
     async def test_generate_and_save(
@@ -136,11 +132,7 @@ class TestNginxGenerator:
             embedded_apps=sample_embedded_apps, isolated_apps=sample_isolated_apps
         )
 
-        assert "Embedded Apps" in summary
-        assert "hello" in summary
-        assert "Isolated Apps" in summary
-        assert "tm1data" in summary
-        assert "port 8001" in summary
+        assert missing_tokens(summary, _SUMMARY_TOKENS) == []
 
     def test_no_isolated_apps(self, nginx_generator, sample_embedded_apps):
         """Should handle case with no isolated apps."""
@@ -3,51 +3,80 @@ Tests for the process manager module.
 Async tests -- spawn_app, stop_app, shutdown_all are now async.
 """
 
-import sys
+import asyncio
+import os
+import shutil
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
+import pyrest.process_manager as _pm_module
 from pyrest.process_manager import AppProcess, ProcessManager, get_process_manager
 
 
-class TestAppProcess:
-    """Tests for AppProcess dataclass."""
+def fake_proc(returncode: int | None = None, pid: int = 12345) -> SimpleNamespace:
+    """Lightweight stand-in for asyncio.subprocess.Process."""
 
-    def test_is_running_true(self):
-        mock_process = MagicMock()
-        mock_process.poll.return_value = None
-        mock_process.pid = 12345
+    async def wait() -> int | None:
+        return returncode
 
-        app_process = AppProcess(
-            name="testapp",
-            port=8001,
-            process=mock_process,
-            app_path=Path("/test/app"),
-        )
-        assert app_process.is_running is True
-        assert app_process.pid == 12345
+    return SimpleNamespace(
+        returncode=returncode, pid=pid, terminate=lambda: None, kill=lambda: None, wait=wait
+    )
+
+
+def _seed(pm: ProcessManager, names: list[str], process: SimpleNamespace | None = None) -> None:
+    """Register one AppProcess per name, all sharing ``process`` (running by default)."""
+    process = process or fake_proc()
+    pm._processes.update(
+        {
+            name: AppProcess(name=name, port=8000 + i, process=process, app_path=Path(f"/test{i}"))
+            for i, name in enumerate(names, 1)
+        }
+    )
+
+
+_CONFIG = SimpleNamespace(
+    isolated_app_base_port=8001,
+    port=8000,
+    base_path="/pyrest",
+    auth_config_file="auth_config.json",
+)
 
-    def test_is_running_false(self):
-        mock_process = MagicMock()
-        mock_process.poll.return_value = 0
 
+@pytest.fixture(scope="session")
+def venv_template(tmp_path_factory) -> Path:
+    """Fake venv layout (bin/python) built once and linked into spawn tests."""
+    venv_path = tmp_path_factory.mktemp("venv_template")
+    venv_bin = venv_path / "bin"
+    venv_bin.mkdir()
+    fake_python = venv_bin / "python"
+    fake_python.touch()
+    fake_python.chmod(0o755)
+    return venv_path
+
+
+class TestAppProcess:
+    """Tests for AppProcess dataclass."""
+
+    @pytest.mark.parametrize(
+        ("returncode", "expected"), [(None, True), (0, False)], ids=["running", "exited"]
+    )
+    def test_is_running(self, returncode, expected):
         app_process = AppProcess(
             name="testapp",
             port=8001,
-            process=mock_process,
+            process=fake_proc(returncode=returncode),
             app_path=Path("/test/app"),
         )
-        assert app_process.is_running is False
-        assert app_process.return_code == 0
+        assert app_process.is_running is expected
+        assert app_process.return_code == returncode
+        assert app_process.pid == 12345
 
     def test_to_dict(self):
-        mock_process = MagicMock()
-        mock_process.poll.return_value = None
-        mock_process.pid = 12345
+        mock_process = fake_proc()
 
         app_process = AppProcess(
             name="testapp",
@@ -68,15 +97,32 @@ class TestAppProcess:
 class TestProcessManager:
     """Tests for ProcessManager class (async methods)."""
 
-    @pytest.fixture
-    def process_manager(self):
-        with patch("pyrest.process_manager.get_config") as mock_config:
-            mock_config.return_value.isolated_app_base_port = 8001
-            mock_config.return_value.port = 8000
-            mock_config.return_value.base_path = "/pyrest"
-            mock_config.return_value.auth_config_file = "auth_config.json"
+    @pytest.fixture(scope="class")
+    def shared_manager(self):
+        """One ProcessManager per class; building it also registers an atexit hook."""
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr("pyrest.process_manager.get_config", lambda: _CONFIG)
             return ProcessManager()
 
+    @pytest.fixture
+    def process_manager(self, shared_manager):
+        yield shared_manager
+        shared_manager._processes.clear()
+        shared_manager._next_port = _CONFIG.isolated_app_base_port
+
+    @pytest.fixture
+    def fake_process(self, monkeypatch):
+        """Make asyncio.create_subprocess_exec return one running fake process."""
+        process = fake_proc()
+        monkeypatch.setattr("asyncio.create_subprocess_exec", AsyncMock(return_value=process))
+        return process
+
+    @pytest.fixture(autouse=True)
+    def _patch_signals(self, monkeypatch):
+        """Keep stop/shutdown from signalling real process groups for the fake PIDs."""
+        monkeypatch.setattr("os.getpgid", lambda pid: pid, raising=False)
+        monkeypatch.setattr("os.killpg", lambda pgid, sig: None, raising=False)
+
     def test_get_next_port(self, process_manager):
         port1 = process_manager.get_next_port()
         port2 = process_manager.get_next_port()
@@ -85,67 +131,56 @@ class TestProcessManager:
         assert port2 == 8002
         assert port3 == 8003
 
-    def test_assign_port_preferred(self, process_manager):
-        port = process_manager.assign_port("testapp", 9000)
-        assert port == 9000
-
-    def test_assign_port_auto(self, process_manager):
-        port = process_manager.assign_port("testapp")
-        assert port == 8001
-
-    def test_assign_port_conflict(self, process_manager):
-        mock_process = MagicMock()
-        mock_process.poll.return_value = None
-        process_manager._processes["existing"] = AppProcess(
-            name="existing",
-            port=9000,
-            process=mock_process,
-            app_path=Path("/test"),
-        )
-        port = process_manager.assign_port("newapp", 9000)
-        assert port != 9000
-        assert port == 8001
+    @pytest.mark.parametrize(
+        ("preferred", "occupied", "expected"),
+        [(9000, False, 9000), (None, False, 8001), (9000, True, 8001)],
+        ids=["preferred", "auto", "conflict"],
+    )
+    def test_assign_port(self, process_manager, preferred, occupied, expected):
+        if occupied:
+            process_manager._processes["existing"] = AppProcess(
+                name="existing",
+                port=preferred,
+                process=fake_proc(),
+                app_path=Path("/test"),
+            )
+        assert process_manager.assign_port("newapp", preferred) == expected
 
     @pytest.mark.asyncio
-    async def test_spawn_app(self, process_manager, temp_dir: Path):
+    async def test_spawn_app(
+        self, process_manager, fake_process, venv_template: Path, temp_dir: Path
+    ):
         """Should spawn app as subprocess (async)."""
         app_path = temp_dir / "testapp"
         app_path.mkdir()
         (app_path / "handlers.py").write_text("def get_handlers(): return []")
         (app_path / "config.json").write_text('{"name": "testapp"}')
 
-        # Create a fake venv
+        # Link in the shared fake venv; copy via hard links where symlinks are not allowed
         venv_path = app_path / ".venv"
-        venv_bin = venv_path / "bin"
-        venv_bin.mkdir(parents=True)
-        fake_python = venv_bin / "python"
-        fake_python.touch()
-        fake_python.chmod(0o755)
-
-        with patch("subprocess.Popen") as mock_popen:
-            mock_process = MagicMock()
-            mock_process.poll.return_value = None
-            mock_process.pid = 12345
-            mock_popen.return_value = mock_process
-
-            result = await process_manager.spawn_app(
-                app_name="testapp",
-                app_path=app_path,
-                port=8001,
-                venv_path=venv_path,
-            )
+        try:
+            venv_path.symlink_to(venv_template, target_is_directory=True)
+        except OSError:
+            shutil.copytree(venv_template, venv_path, copy_function=os.link)
 
-            assert result is not None
-            assert result.name == "testapp"
-            assert result.port == 8001
-            assert "testapp" in process_manager._processes
+        result = await process_manager.spawn_app(
+            app_name="testapp",
+            app_path=app_path,
+            port=8001,
+            venv_path=venv_path,
+        )
+
+        assert result is not None
+        assert result.name == "testapp"
+        assert result.port == 8001
+        assert result.process is fake_process
+        assert "testapp" in process_manager._processes
 
     @pytest.mark.asyncio
     async def test_spawn_app_already_running(self, process_manager, temp_dir: Path):
         """Should return existing process if already running (async)."""
         app_path = temp_dir / "testapp"
-        mock_process = MagicMock()
-        mock_process.poll.return_value = None
+        mock_process = fake_proc()
 
         existing = AppProcess(
             name="testapp",
@@ -179,10 +214,7 @@ class TestProcessManager:
     @pytest.mark.asyncio
     async def test_stop_app(self, process_manager):
         """Should stop running app (async)."""
-        mock_process = MagicMock()
-        mock_process.poll.return_value = None
-        mock_process.pid = 12345
-        mock_process.wait.return_value = 0
+        mock_process = fake_proc()
 
         process_manager._processes["testapp"] = AppProcess(
             name="testapp",
@@ -191,12 +223,37 @@ class TestProcessManager:
             app_path=Path("/test"),
         )
 
-        with patch("os.getpgid", return_value=12345, create=True), patch("os.killpg", create=True):
-            result = await process_manager.stop_app("testapp")
+        result = await process_manager.stop_app("testapp")
 
         assert result is True
         assert "testapp" not in process_manager._processes
 
+    @pytest.mark.asyncio
+    async def test_stop_app_force_kill(self, process_manager, monkeypatch):
+        """Should kill the app when it ignores SIGTERM past the timeout (async)."""
+        wait_calls = 0
+        killed = []
+
+        async def wait():
+            nonlocal wait_calls
+            wait_calls += 1
+            if wait_calls == 1:
+                await asyncio.Event().wait()  # Never set: hangs until the timeout
+            return -9
+
+        process = fake_proc()
+        process.wait = wait
+        process.kill = lambda: killed.append(True)
+        _seed(process_manager, ["stubborn"], process)
+        monkeypatch.setattr("pyrest.process_manager.is_valid_pid", lambda pid: False)
+
+        result = await process_manager.stop_app("stubborn", timeout=0.01)
+
+        assert result is True
+        assert killed == [True]
+        assert wait_calls == 2
+        assert "stubborn" not in process_manager._processes
+
     @pytest.mark.asyncio
     async def test_stop_app_not_running(self, process_manager):
         """Should return False for non-running app (async)."""
@@ -204,33 +261,15 @@ class TestProcessManager:
         assert result is False
 
     def test_get_running_apps(self, process_manager):
-        mock_running = MagicMock()
-        mock_running.poll.return_value = None
-
-        mock_stopped = MagicMock()
-        mock_stopped.poll.return_value = 0
-
-        process_manager._processes["running"] = AppProcess(
-            name="running",
-            port=8001,
-            process=mock_running,
-            app_path=Path("/test"),
-        )
-        process_manager._processes["stopped"] = AppProcess(
-            name="stopped",
-            port=8002,
-            process=mock_stopped,
-            app_path=Path("/test"),
-        )
+        _seed(process_manager, ["running"])
+        _seed(process_manager, ["stopped"], fake_proc(returncode=0))
 
         running = process_manager.get_running_apps()
         assert len(running) == 1
         assert running[0].name == "running"
 
     def test_get_app_status(self, process_manager):
-        mock_process = MagicMock()
-        mock_process.poll.return_value = None
-        mock_process.pid = 12345
+        mock_process = fake_proc()
 
         process_manager._processes["testapp"] = AppProcess(
             name="testapp",
@@ -245,22 +284,7 @@ class TestProcessManager:
         assert status["is_running"] is True
 
     def test_get_all_status(self, process_manager):
-        mock_process = MagicMock()
-        mock_process.poll.return_value = None
-        mock_process.pid = 12345
-
-        process_manager._processes["app1"] = AppProcess(
-            name="app1",
-            port=8001,
-            process=mock_process,
-            app_path=Path("/test1"),
-        )
-        process_manager._processes["app2"] = AppProcess(
-            name="app2",
-            port=8002,
-            process=mock_process,
-            app_path=Path("/test2"),
-        )
+        _seed(process_manager, ["app1", "app2"])
 
         statuses = process_manager.get_all_status()
         assert len(statuses) == 2
@@ -268,26 +292,9 @@ class TestProcessManager:
     @pytest.mark.asyncio
     async def test_shutdown_all(self, process_manager):
         """Should stop all running apps (async)."""
-        mock_process = MagicMock()
-        mock_process.poll.return_value = None
-        mock_process.pid = 12345
-        mock_process.wait.return_value = 0
+        _seed(process_manager, ["app1", "app2"])
 
-        process_manager._processes["app1"] = AppProcess(
-            name="app1",
-            port=8001,
-            process=mock_process,
-            app_path=Path("/test1"),
-        )
-        process_manager._processes["app2"] = AppProcess(
-            name="app2",
-            port=8002,
-            process=mock_process,
-            app_path=Path("/test2"),
-        )
-
-        with patch("os.getpgid", return_value=12345, create=True), patch("os.killpg", create=True):
-            await process_manager.shutdown_all()
+        await process_manager.shutdown_all()
 
         assert len(process_manager._processes) == 0
 
@@ -295,10 +302,8 @@ class TestProcessManager:
 class TestGetProcessManager:
     """Tests for get_process_manager singleton."""
 
-    def test_singleton(self):
-        import pyrest.process_manager as pm
-
-        pm._process_manager = None
+    def test_singleton(self, monkeypatch):
+        monkeypatch.setattr(_pm_module, "_process_manager", None)
 
         with patch("pyrest.process_manager.get_config") as mock_config:
             mock_config.return_value.isolated_app_base_port = 8001
@@ -2,15 +2,14 @@
 Tests for the logging utilities module.
 """
 
+import copy
 import json
 import logging
-import sys
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
 
 import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from pyrest.utils.logging import (
     AppLogger,
     JSONFormatter,
@@ -22,67 +21,66 @@ from pyrest.utils.logging import (
 )
 
 
+@pytest.fixture(scope="module")
+def make_record():
+    """Build LogRecords by copying one prebuilt record and overriding a few fields."""
+    base = logging.LogRecord(
+        name="test",
+        level=logging.INFO,
+        pathname="test.py",
+        lineno=10,
+        msg="Test message",
+        args=(),
+        exc_info=None,
+        func="test_func",
+    )
+
+    def make(level=logging.INFO, msg="Test message", **attrs):
+        record = copy.copy(base)
+        record.levelno = level
+        record.levelname = logging.getLevelName(level)
+        record.msg = msg
+        record.__dict__.update(attrs)
+        return record
+
+    return make
+
+
 class TestSmartFormatter:
     """Tests for SmartFormatter class."""
 
-    def test_basic_format(self):
+    def test_basic_format(self, make_record):
         """Should format log record with basic format."""
         formatter = SmartFormatter(
             fmt="%(asctime)s | %(levelname)s | %(message)s", use_colors=False
         )
 
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="test.py",
-            lineno=10,
-            msg="Test message",
-            args=(),
-            exc_info=None,
-        )
+        record = make_record()
 
         result = formatter.format(record)
 
         assert "INFO" in result
         assert "Test message" in result
 
-    def test_location_for_errors(self):
+    def test_location_for_errors(self, make_record):
         """Should include location info for errors."""
         formatter = SmartFormatter(
             fmt="%(levelname)s | %(name)s | %(message)s", use_colors=False, include_location=True
         )
 
-        record = logging.LogRecord(
-            name="test",
-            level=logging.ERROR,
-            pathname="test.py",
-            lineno=25,
-            msg="Error message",
-            args=(),
-            exc_info=None,
-        )
-        record.filename = "test.py"
+        record = make_record(level=logging.ERROR, msg="Error message", lineno=25)
 
         result = formatter.format(record)
 
         assert "[test.py:25]" in result
 
-    def test_no_location_for_info(self):
+    def test_no_location_for_info(self, make_record):
         """Should not include location for INFO level."""
         formatter = SmartFormatter(
             fmt="%(levelname)s | %(message)s", use_colors=False, include_location=True
         )
 
-        record = logging.LogRecord(
-            name="test",
-            level=logging.INFO,
-            pathname="test.py",
-            lineno=10,
-            msg="Info message",
-            args=(),
-            exc_info=None,
-        )
-        record.filename = "test.py"
+        record = make_record(msg="Info message")
 
         result = formatter.format(record)
 
@@ -92,21 +90,11 @@ class TestSmartFormatter:
 class TestJSONFormatter:
     """Tests for JSONFormatter class."""
 
-    def test_json_output(self):
+    def test_json_output(self, make_record):
         """Should output valid JSON."""
         formatter = JSONFormatter(app_name="testapp")
 
-        record = logging.LogRecord(
-            name="test.logger",
-            level=logging.INFO,
-            pathname="test.py",
-            lineno=10,
-            msg="Test message",
-            args=(),
-            exc_info=None,
-        )
-        record.filename = "test.py"
-        record.funcName = "test_func"
+        record = make_record(name="test.logger")
 
         result = formatter.format(record)
 
@@ -119,8 +107,9 @@ class TestJSONFormatter:
         assert "timestamp" in data
         assert data["location"]["file"] == "test.py"
         assert data["location"]["line"] == 10
+        assert "extra" not in data  # Standard record attributes are not extras
 
-    def test_json_with_exception(self):
+    def test_json_with_exception(self, make_record):
         """Should include exception info in JSON output."""
         formatter = JSONFormatter(app_name="testapp")
 
@@ -131,17 +120,7 @@ class TestJSONFormatter:
 
             exc_info = sys.exc_info()
 
-        record = logging.LogRecord(
-            name="test",
-            level=logging.ERROR,
-            pathname="test.py",
-            lineno=10,
-            msg="Error occurred",
-            args=(),
-            exc_info=exc_info,
-        )
-        record.filename = "test.py"
-        record.funcName = "test_func"
+        record = make_record(level=logging.ERROR, msg="Error occurred", exc_info=exc_info)
 
         result = formatter.format(record)
         data = json.loads(result)
@@ -150,10 +129,64 @@ class TestJSONFormatter:
         assert data["exception"]["type"] == "ValueError"
         assert "Test error" in data["exception"]["message"]
 
+    def test_json_timestamp_from_record(self, make_record):
+        """Should stamp the record's creation time, not the time it was formatted."""
+        formatter = JSONFormatter(app_name="testapp")
+
+        record = make_record(msg="Stamped")
+
+        for created in (1_700_000_000.25, 1_700_000_000.9999996, 1_700_000_001.000001):
+            record.created = created
+            data = json.loads(formatter.format(record))
+            expected = datetime.fromtimestamp(created, UTC).isoformat(timespec="microseconds")
+            assert data["timestamp"] == expected
+
+    def test_json_unserializable_extra(self, make_record):
+        """Should stringify extra fields the JSON encoder cannot handle."""
+        formatter = JSONFormatter(app_name="testapp")
+
+        record = make_record(msg="With extras")
+        record.request_id = 42
+        record.client = object()
+
+        result = formatter.format(record)
+        data = json.loads(result)
+
+        assert "\n" not in result
+        assert data["extra"]["request_id"] == 42
+        assert data["extra"]["client"].startswith("<object object")
+
+    def test_json_stdlib_fallback(self, make_record, monkeypatch):
+        """Should emit the same compact JSON through the stdlib json module."""
+        monkeypatch.setattr("pyrest.utils.logging.ORJSON_AVAILABLE", False)
+        formatter = JSONFormatter(app_name="testapp")
+
+        record = make_record(msg="Fallback")
+        record.request_id = 42
+        record.client = object()
+
+        result = formatter.format(record)
+        data = json.loads(result)
+
+        assert ", " not in result
+        assert '"level":"INFO"' in result
+        assert data["extra"]["request_id"] == 42
+        assert data["extra"]["client"].startswith("<object object")
+
 
 class TestAppLogger:
     """Tests for AppLogger class."""
 
+    @pytest.fixture(scope="class")
+    def app_logger(self, tmp_path_factory):
+        """One INFO-level AppLogger shared by the class; opening its files is the slow part."""
+        app_logger = AppLogger(
+            app_name="testapp", log_dir=tmp_path_factory.mktemp("logs"), log_level=logging.INFO
+        )
+        yield app_logger
+        for handler in app_logger.logger.handlers:
+            handler.close()
+
     @pytest.fixture
     def log_dir(self, temp_dir):
         """Create a temporary log directory."""
@@ -161,18 +194,14 @@ class TestAppLogger:
         log_path.mkdir()
         return log_path
 
-    def test_create_logger(self, log_dir):
+    def test_create_logger(self, app_logger):
         """Should create app-specific logger."""
-        app_logger = AppLogger(app_name="testapp", log_dir=log_dir, log_level=logging.INFO)
-
         assert app_logger.app_name == "testapp"
         assert app_logger.logger.name == "pyrest.app.testapp"
         assert app_logger.logger.level == logging.INFO
 
-    def test_creates_log_files(self, log_dir):
+    def test_creates_log_files(self, app_logger):
         """Should create log files in directory."""
-        app_logger = AppLogger(app_name="testapp", log_dir=log_dir, log_level=logging.INFO)
-
         # Write some logs to trigger file creation
         app_logger.info("Test message")
         app_logger.error("Error message")
@@ -182,15 +211,15 @@ class TestAppLogger:
             handler.flush()
 
         # Check files exist
-        log_file = log_dir / "testapp.log"
-        error_log_file = log_dir / "testapp.error.log"
+        log_file = app_logger.log_dir / "testapp.log"
+        error_log_file = app_logger.log_dir / "testapp.error.log"
 
         assert log_file.exists()
         assert error_log_file.exists()
 
     def test_log_methods(self, log_dir):
         """Should have all standard log methods."""
-        app_logger = AppLogger(app_name="testapp", log_dir=log_dir, log_level=logging.DEBUG)
+        app_logger = AppLogger(app_name="debugapp", log_dir=log_dir, log_level=logging.DEBUG)
 
         # These should not raise
         app_logger.debug("Debug message")
@@ -199,19 +228,21 @@ class TestAppLogger:
         app_logger.error("Error message")
         app_logger.critical("Critical message")
 
-    def test_get_logger(self, log_dir):
-        """Should return underlying Python logger."""
-        app_logger = AppLogger(app_name="testapp", log_dir=log_dir)
+        for handler in app_logger.logger.handlers:
+            handler.flush()
+        content = (log_dir / "debugapp.log").read_text(encoding="utf-8")
+        assert "Debug message" in content
+        assert "Critical message" in content
 
+    def test_get_logger(self, app_logger):
+        """Should return underlying Python logger."""
         logger = app_logger.get_logger()
 
         assert isinstance(logger, logging.Logger)
         assert logger.name == "pyrest.app.testapp"
 
-    def test_log_request(self, log_dir):
+    def test_log_request(self, app_logger):
         """Should log HTTP requests with structured data."""
-        app_logger = AppLogger(app_name="testapp", log_dir=log_dir, log_level=logging.DEBUG)
-
         # Should not raise
         app_logger.log_request(
             method="GET", path="/api/data", status_code=200, duration_ms=45.5, user="testuser"
@@ -221,10 +252,27 @@ class TestAppLogger:
             method="POST", path="/api/update", status_code=500, duration_ms=120.0
         )
 
-    def test_log_tm1_operation(self, log_dir):
-        """Should log TM1 operations with structured data."""
-        app_logger = AppLogger(app_name="testapp", log_dir=log_dir, log_level=logging.DEBUG)
+        for handler in app_logger.logger.handlers:
+            handler.flush()
+        content = (app_logger.log_dir / "testapp.log").read_text(encoding="utf-8")
+        assert "GET /api/data -> 200 (45.50ms)" in content
+        assert "POST /api/update -> 500 (120.00ms)" in content
+
+    def test_log_request_below_level(self, log_dir):
+        """Should skip requests whose level is filtered out."""
+        app_logger = AppLogger(app_name="quietapp", log_dir=log_dir, log_level=logging.WARNING)
 
+        app_logger.log_request(method="GET", path="/api/data", status_code=200, duration_ms=1.0)
+        app_logger.log_request(method="GET", path="/api/gone", status_code=404, duration_ms=1.0)
+
+        for handler in app_logger.logger.handlers:
+            handler.flush()
+        content = (log_dir / "quietapp.log").read_text(encoding="utf-8")
+        assert "/api/data" not in content
+        assert "GET /api/gone -> 404" in content
+
+    def test_log_tm1_operation(self, app_logger):
+        """Should log TM1 operations with structured data."""
         # Should not raise
         app_logger.log_tm1_operation(
             operation="get_cubes",
@@ -241,9 +289,22 @@ class TestAppLogger:
             details={"error": "Connection failed"},
         )
 
+    def test_buffered_flushes_on_error(self, log_dir):
+        """Should hold records in memory until an ERROR arrives."""
+        app_logger = AppLogger(app_name="bufferedapp", log_dir=log_dir, buffered=True)
+        log_file = log_dir / "bufferedapp.log"
+
+        app_logger.info("Buffered message")
+        assert "Buffered message" not in log_file.read_text(encoding="utf-8")
+
+        app_logger.error("Flushing error")
+        content = log_file.read_text(encoding="utf-8")
+        assert "Buffered message" in content
+        assert "Flushing error" in content
+
     def test_json_format(self, log_dir):
         """Should use JSON formatter when specified."""
-        app_logger = AppLogger(app_name="testapp", log_dir=log_dir, use_json=True)
+        app_logger = AppLogger(app_name="jsonapp", log_dir=log_dir, use_json=True)
 
         # Check that file handler uses JSONFormatter
         file_handlers = [
@@ -255,10 +316,8 @@ class TestAppLogger:
         assert len(file_handlers) > 0
         assert isinstance(file_handlers[0].formatter, JSONFormatter)
 
-    def test_no_propagation(self, log_dir):
+    def test_no_propagation(self, app_logger):
         """Should not propagate to root logger."""
-        app_logger = AppLogger(app_name="testapp", log_dir=log_dir)
-
         assert app_logger.logger.propagate is False
 
 
@@ -318,6 +377,15 @@ class TestLoggingFunctions:
 
         assert logger1 is logger2
 
+    def test_get_or_create_app_logger_threads(self, temp_dir):
+        """Should create exactly one logger when threads race for it."""
+        log_dir = temp_dir / "logs"
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            loggers = list(pool.map(lambda _: get_or_create_app_logger("myapp", log_dir), range(8)))
+
+        assert all(logger is loggers[0] for logger in loggers)
+
     def test_multiple_app_loggers(self, temp_dir):
         """Should handle multiple app loggers."""
         log_dir = temp_dir / "logs"
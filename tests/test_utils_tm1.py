@@ -3,11 +3,9 @@ Tests for the TM1 utilities module.
 """
 
 import os
-import sys
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+import pytest
 
 from pyrest.utils.tm1 import TM1ConnectionManager, TM1InstanceConfig, is_tm1_available
 
@@ -99,6 +97,29 @@ class TestTM1InstanceConfig:
 
         assert instance.get("server") == "localhost"
 
+    def test_env_var_multiple_references(self, monkeypatch):
+        """Should resolve every reference embedded in one value."""
+        monkeypatch.setenv("TEST_HOST", "tm1.company.com")
+        monkeypatch.delenv("TEST_TM1_PORT", raising=False)
+
+        config = {"base_url": "https://${TEST_HOST}:${TEST_TM1_PORT:-443}/api"}
+
+        instance = TM1InstanceConfig("test", config)
+
+        assert instance.get("base_url") == "https://tm1.company.com:443/api"
+
+    def test_env_var_value_not_re_expanded(self, monkeypatch):
+        """Should keep "${" inside an env value as literal text."""
+        monkeypatch.setenv("TEST_TM1_PASSWORD", "abc${xyz}")
+        monkeypatch.setenv("TEST_SELF_REF", "x${TEST_SELF_REF}")
+
+        config = {"password": "${TEST_TM1_PASSWORD}", "self": "${TEST_SELF_REF}"}
+
+        instance = TM1InstanceConfig("test", config)
+
+        assert instance.get("password") == "abc${xyz}"
+        assert instance.get("self") == "x${TEST_SELF_REF}"
+
     def test_build_onprem_params(self):
         """Should build on-premise connection parameters."""
         config = {
@@ -228,6 +249,18 @@ class TestTM1ConnectionManager:
         assert TM1ConnectionManager.get_default_instance() == "production"
         assert len(TM1ConnectionManager.get_all_instances()) == 2
 
+    def test_get_all_instances_read_only(self):
+        """Should expose instances without letting callers modify the registry."""
+        TM1ConnectionManager.initialize(
+            {"tm1_instances": {"production": {"connection_type": "onprem"}}}
+        )
+
+        instances = TM1ConnectionManager.get_all_instances()
+
+        assert list(instances) == ["production"]
+        with pytest.raises(TypeError):
+            instances["rogue"] = None
+
     def test_initialize_once(self):
         """Should only initialize once."""
         app_config = {
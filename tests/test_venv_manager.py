@@ -3,13 +3,16 @@ Tests for the virtual environment manager module.
 Async tests -- methods like create_venv, install_requirements, ensure_venv are now async.
 """
 
+import shutil
+import subprocess
 import sys
 from pathlib import Path
+from unittest.mock import AsyncMock
 
 import pytest
+import pytest_asyncio
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
+import pyrest.venv_manager as _vm_module
 from pyrest.venv_manager import VenvManager, get_venv_manager
 
 # VenvManager hardcodes Linux paths (bin/python, bin/pip) for Docker production use.
@@ -20,13 +23,51 @@ _skip_on_windows = pytest.mark.skipif(
 )
 
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def prebuilt_venv(tmp_path_factory) -> Path:
+    """Create one real venv per session; tests that only need an existing one copy it."""
+    venv_path = tmp_path_factory.mktemp("seed_venv") / ".venv"
+    success, message = await VenvManager().create_venv(venv_path)
+    assert success, message
+    return venv_path
+
+
+def copy_venv(prebuilt_venv: Path, target: Path) -> Path:
+    """Copy the session venv to target, keeping its interpreter symlinks intact.
+
+    On Linux ``cp --reflink=auto`` clones the files where the filesystem supports
+    it and is still several times faster than copytree for a pip-seeded venv.
+    """
+    if sys.platform == "linux" and shutil.which("cp"):
+        try:
+            subprocess.run(
+                ["cp", "-a", "--reflink=auto", str(prebuilt_venv), str(target)],
+                check=True,
+                capture_output=True,
+            )
+        except (OSError, subprocess.CalledProcessError):
+            shutil.rmtree(target, ignore_errors=True)
+        else:
+            return target
+    shutil.copytree(prebuilt_venv, target, symlinks=True)
+    return target
+
+
 class TestVenvManager:
     """Tests for VenvManager class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def venv_manager(self):
+        """VenvManager is stateless after init, which probes for uv with a subprocess."""
         return VenvManager()
 
+    @pytest.fixture
+    def fake_run_cmd(self, monkeypatch):
+        """Replace the module's subprocess helper; set return_value per test."""
+        run_cmd = AsyncMock(return_value=(0, "", ""))
+        monkeypatch.setattr(_vm_module, "_run_cmd", run_cmd)
+        return run_cmd
+
     def test_get_venv_path(self, venv_manager, temp_dir: Path):
         """Should return correct venv path."""
         app_path = temp_dir / "myapp"
@@ -71,7 +112,7 @@ class TestVenvManager:
         assert venv_manager.has_requirements(app_path) is False
 
     @_skip_on_windows
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_create_venv(self, venv_manager, temp_dir: Path):
         """Should create virtual environment (async)."""
         venv_path = temp_dir / "test_venv"
@@ -80,12 +121,12 @@ class TestVenvManager:
         assert venv_path.exists()
         assert venv_manager.get_python_executable(venv_path).exists()
 
+    @pytest.mark.slow
     @_skip_on_windows
-    @pytest.mark.asyncio
-    async def test_install_requirements(self, venv_manager, temp_dir: Path):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_install_requirements(self, venv_manager, temp_dir: Path, prebuilt_venv):
         """Should install requirements into venv (async)."""
-        venv_path = temp_dir / "venv_for_install"
-        await venv_manager.create_venv(venv_path)
+        venv_path = copy_venv(prebuilt_venv, temp_dir / "venv_for_install")
 
         req_file = temp_dir / "requirements.txt"
         req_file.write_text("pip")
@@ -94,9 +135,10 @@ class TestVenvManager:
         assert success is True
 
     @_skip_on_windows
-    @pytest.mark.asyncio
-    async def test_install_requirements_no_pip(self, venv_manager, temp_dir: Path):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_install_requirements_no_pip(self, venv_manager, temp_dir: Path, monkeypatch):
         """Should fail if pip not found (async)."""
+        monkeypatch.setattr(venv_manager, "_uv_available", False)  # pip is only checked without uv
         venv_path = temp_dir / "no_pip_venv"
         venv_path.mkdir()
 
@@ -107,7 +149,33 @@ class TestVenvManager:
         assert success is False
         assert "pip not found" in message
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_create_venv_failure(self, venv_manager, temp_dir: Path, fake_run_cmd):
+        """Should report the tool's stderr when venv creation fails (async)."""
+        fake_run_cmd.return_value = (1, "", "boom")
+
+        success, message = await venv_manager.create_venv(temp_dir / "broken_venv")
+
+        assert success is False
+        assert message == "boom"
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_install_requirements_failure(
+        self, venv_manager, temp_dir: Path, fake_run_cmd, monkeypatch
+    ):
+        """Should report the installer's stderr when installation fails (async)."""
+        monkeypatch.setattr(venv_manager, "_uv_available", True)
+        fake_run_cmd.return_value = (1, "", "no matching distribution")
+        req_file = temp_dir / "requirements.txt"
+        req_file.write_text("doesnotexist")
+
+        success, message = await venv_manager.install_requirements(temp_dir / ".venv", req_file)
+
+        assert success is False
+        assert message == "no matching distribution"
+        assert fake_run_cmd.await_args.args[:3] == ("uv", "pip", "install")
+
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_ensure_venv_no_requirements(self, venv_manager, temp_dir: Path):
         """Should skip venv creation if no requirements.txt (async)."""
         app_path = temp_dir / "no_reqs_app"
@@ -117,31 +185,122 @@ class TestVenvManager:
         assert success is True
         assert "No requirements.txt" in message
 
+    @pytest.mark.slow
     @_skip_on_windows
-    @pytest.mark.asyncio
-    async def test_ensure_venv_with_requirements(self, venv_manager, temp_dir: Path):
-        """Should create venv and install requirements (async)."""
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_ensure_venv_with_requirements(self, venv_manager, temp_dir: Path, prebuilt_venv):
+        """Should reuse an existing venv and install requirements (async)."""
         app_path = temp_dir / "app_with_reqs"
         app_path.mkdir()
         (app_path / "requirements.txt").write_text("pip")
+        copy_venv(prebuilt_venv, app_path / ".venv")
 
         success, venv_path, message = await venv_manager.ensure_venv(app_path)
         assert success is True
         assert venv_path.exists()
         assert "ready" in message.lower()
 
-    @pytest.mark.asyncio
-    async def test_remove_venv(self, venv_manager, temp_dir: Path):
+    @_skip_on_windows
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_ensure_venv_follows_symlink(
+        self, venv_manager, temp_dir: Path, prebuilt_venv, fake_run_cmd
+    ):
+        """Should work on the target of a symlinked .venv, not the link."""
+        real_venv = copy_venv(prebuilt_venv, temp_dir / "shared_venv")
+        app_path = temp_dir / "linked_app"
+        app_path.mkdir()
+        (app_path / "requirements.txt").write_text("pip")
+        (app_path / ".venv").symlink_to(real_venv, target_is_directory=True)
+
+        success, venv_path, _msg = await venv_manager.ensure_venv(app_path)
+
+        assert success is True
+        assert venv_path == real_venv.resolve()
+
+    @pytest.mark.slow
+    @_skip_on_windows
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_ensure_venv_creates_venv(self, venv_manager, temp_dir: Path):
+        """Should create a venv from scratch and install requirements (async)."""
+        app_path = temp_dir / "fresh_app"
+        app_path.mkdir()
+        (app_path / "requirements.txt").write_text("pip")
+
+        success, venv_path, message = await venv_manager.ensure_venv(app_path)
+        assert success is True, message
+        assert venv_manager.venv_exists(venv_path)
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_remove_venv(self, venv_manager, temp_dir: Path, prebuilt_venv):
         """Should remove venv directory (async)."""
-        venv_path = temp_dir / "removable_venv"
-        await venv_manager.create_venv(venv_path)
+        venv_path = copy_venv(prebuilt_venv, temp_dir / "removable_venv")
         assert venv_path.exists()
 
         ok, _msg = await venv_manager.remove_venv(venv_path)
         assert ok is True
         assert not venv_path.exists()
+        assert list(temp_dir.glob(".trash-*")) == []
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_remove_venv_delete_fails(self, venv_manager, temp_dir: Path, monkeypatch):
+        """Should count a renamed-away venv as removed and leave its files for the sweep."""
+        venv_path = temp_dir / ".venv"
+        venv_path.mkdir()
+
+        def fail_rmtree(path):
+            raise PermissionError("read-only file")
+
+        monkeypatch.setattr(_vm_module.shutil, "rmtree", fail_rmtree)
+        ok, _msg = await venv_manager.remove_venv(venv_path)
+
+        assert ok is True
+        assert not venv_path.exists()
+        assert len(list(temp_dir.glob(".trash-*"))) == 1
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_remove_venv_rename_fails(self, venv_manager, temp_dir: Path, monkeypatch):
+        """Should report failure when the venv cannot be moved out of the way."""
+        venv_path = temp_dir / ".venv"
+        venv_path.mkdir()
+
+        def fail_rename(self, target):
+            raise PermissionError("busy")
+
+        monkeypatch.setattr(Path, "rename", fail_rename)
+        ok, msg = await venv_manager.remove_venv(venv_path)
+
+        assert ok is False
+        assert "busy" in msg
+        assert venv_path.exists()
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_ensure_venv_sweeps_trash(self, venv_manager, temp_dir: Path):
+        """Should delete venvs an earlier remove_venv left behind."""
+        app_path = temp_dir / "app"
+        (app_path / ".trash-venv-0123").mkdir(parents=True)
+
+        success, _venv_path, _msg = await venv_manager.ensure_venv(app_path)
+
+        assert success is True
+        assert list(app_path.glob(".trash-*")) == []
+
+    @_skip_on_windows
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_ensure_venv_sweeps_symlink_target_trash(self, venv_manager, temp_dir: Path):
+        """Should sweep trash left next to the target of a symlinked .venv."""
+        shared = temp_dir / "shared"
+        (shared / "venv").mkdir(parents=True)
+        (shared / ".trash-venv-0123").mkdir()
+        app_path = temp_dir / "linked_app"
+        app_path.mkdir()
+        (app_path / ".venv").symlink_to(shared / "venv", target_is_directory=True)
+
+        success, _venv_path, _msg = await venv_manager.ensure_venv(app_path)
+
+        assert success is True
+        assert list(shared.glob(".trash-*")) == []
+
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_remove_venv_nonexistent(self, venv_manager, temp_dir: Path):
         """Should succeed when removing nonexistent venv."""
         venv_path = temp_dir / "does_not_exist"
@@ -173,10 +332,8 @@ class TestVenvManager:
 class TestGetVenvManager:
     """Tests for get_venv_manager singleton."""
 
-    def test_singleton(self):
-        import pyrest.venv_manager as vm
-
-        vm._venv_manager = None
+    def test_singleton(self, monkeypatch):
+        monkeypatch.setattr(_vm_module, "_venv_manager", None)
 
         manager1 = get_venv_manager()
         manager2 = get_venv_manager()